@@ -2,6 +2,8 @@ package docparser
 
 import (
 	"strings"
+	"sync"
+	"time"
 
 	"github.com/Tencent/WeKnora/internal/types"
 )
@@ -52,6 +54,41 @@ func (e *simpleEngine) CheckAvailable(_ bool, _ map[string]string) (bool, string
 	return true, ""
 }
 
+// ---------------------------------------------------------------------------
+// availability cache — engine listing runs on every settings/engines request;
+// remember successful pings briefly instead of re-probing remote services.
+// Failures are never cached, so a fixed configuration is picked up at once.
+// ---------------------------------------------------------------------------
+
+const pingCacheTTL = 60 * time.Second
+
+var (
+	pingCacheMu sync.Mutex
+	pingCache   = make(map[string]time.Time) // key -> time of last successful ping
+)
+
+// cachedPing returns a recent successful result for key, or runs ping and
+// remembers it when it succeeds.
+func cachedPing(key string, ping func() (bool, string)) (bool, string) {
+	pingCacheMu.Lock()
+	okAt, hit := pingCache[key]
+	pingCacheMu.Unlock()
+	if hit && time.Since(okAt) < pingCacheTTL {
+		return true, ""
+	}
+
+	available, reason := ping()
+
+	pingCacheMu.Lock()
+	if available {
+		pingCache[key] = time.Now()
+	} else {
+		delete(pingCache, key)
+	}
+	pingCacheMu.Unlock()
+	return available, reason
+}
+
 // ---------------------------------------------------------------------------
 // mineru — Go-native, calls self-hosted MinerU API directly
 // ---------------------------------------------------------------------------
@@ -68,7 +105,7 @@ func (e *mineruEngine) CheckAvailable(_ bool, overrides map[string]string) (bool
 	if endpoint == "" {
 		return false, "MinerU service not configured"
 	}
-	return PingMinerU(endpoint)
+	return cachedPing("mineru:"+endpoint, func() (bool, string) { return PingMinerU(endpoint) })
 }
 
 // ---------------------------------------------------------------------------
@@ -87,7 +124,7 @@ func (e *mineruCloudEngine) CheckAvailable(_ bool, overrides map[string]string)
 	if apiKey == "" {
 		return false, "MinerU API Key not configured"
 	}
-	return PingMinerUCloud(apiKey)
+	return cachedPing("mineru_cloud:"+apiKey, func() (bool, string) { return PingMinerUCloud(apiKey) })
 }
 
 // ---------------------------------------------------------------------------
@@ -0,0 +1,33 @@
+package docparser
+
+import "testing"
+
+func TestCachedPingOnlyCachesSuccess(t *testing.T) {
+	calls := 0
+	up := false
+	ping := func() (bool, string) {
+		calls++
+		if up {
+			return true, ""
+		}
+		return false, "down"
+	}
+	key := "test:" + t.Name()
+
+	if ok, _ := cachedPing(key, ping); ok {
+		t.Fatal("expected unavailable")
+	}
+	cachedPing(key, ping)
+	if calls != 2 {
+		t.Fatalf("failures must not be cached, got %d calls", calls)
+	}
+
+	up = true
+	cachedPing(key, ping)
+	if ok, _ := cachedPing(key, ping); !ok {
+		t.Fatal("expected cached success")
+	}
+	if calls != 3 {
+		t.Fatalf("success should be cached, got %d calls", calls)
+	}
+}
@@ -15,6 +15,7 @@ import (
 	"github.com/Tencent/WeKnora/internal/types"
 	"github.com/Tencent/WeKnora/internal/types/interfaces"
 	"github.com/google/uuid"
+	"golang.org/x/sync/errgroup"
 )
 
 const (
@@ -24,8 +25,13 @@ const (
 	// minImageBytes is the minimum file size in bytes; very small images are
 	// almost certainly icons or decorative elements.
 	minImageBytes = 512 // 512 bytes
+	// maxConcurrentImageSaves bounds parallel FileService uploads per document.
+	maxConcurrentImageSaves = 8
 )
 
+// markdownImagePattern matches markdown images; group 2 is the URL/path.
+var markdownImagePattern = regexp.MustCompile(`!\[([^\]]*)\]\(([^)]+)\)`)
+
 // isIconImage returns true if the image data looks like a small icon or
 // decorative element that should be filtered out. It checks pixel dimensions
 // when decodable, and falls back to raw byte size otherwise.
@@ -81,12 +87,19 @@ func (r *ImageResolver) ResolveAndStore(
 	}
 
 	// Process each image reference found in the markdown
-	imgPattern := regexp.MustCompile(`!\[([^\]]*)\]\(([^)]+)\)`)
-	matches := imgPattern.FindAllStringSubmatchIndex(markdown, -1)
-
-	// Process in reverse order to preserve positions when replacing
-	for i := len(matches) - 1; i >= 0; i-- {
-		m := matches[i]
+	matches := markdownImagePattern.FindAllStringSubmatchIndex(markdown, -1)
+
+	// First pass (cheap, sequential): decide what to do with every match.
+	type imageJob struct {
+		refPath    string
+		ref        types.ImageRef
+		fileName   string
+		drop       bool // icon/decorative image, remove the reference
+		upload     bool
+		servingURL string
+	}
+	jobs := make([]imageJob, len(matches))
+	for i, m := range matches {
 		refPath := markdown[m[4]:m[5]] // group 2: the URL/path
 
 		// Skip already-resolved URLs (http/https, unified /files/, or provider:// scheme)
@@ -103,8 +116,7 @@ func (r *ImageResolver) ResolveAndStore(
 
 		// Filter out small icons and decorative images
 		if isIconImage(ref.ImageData) {
-			// Remove the image reference from markdown entirely
-			markdown = markdown[:m[0]] + markdown[m[1]:]
+			jobs[i] = imageJob{drop: true}
 			continue
 		}
 
@@ -117,25 +129,62 @@ func (r *ImageResolver) ResolveAndStore(
 			ext = ".png"
 		}
 
-		// Save via FileService — returns provider:// path
-		fileName := uuid.New().String() + ext
-		servingURL, saveErr := fileSvc.SaveBytes(ctx, ref.ImageData, tenantID, fileName, false)
-		if saveErr != nil {
-			log.Printf("WARN: failed to save image %s: %v", refPath, saveErr)
-			continue
+		jobs[i] = imageJob{
+			refPath:  refPath,
+			ref:      ref,
+			fileName: uuid.New().String() + ext,
+			upload:   true,
 		}
+	}
 
-		images = append(images, StoredImage{
-			OriginalRef: refPath,
-			ServingURL:  servingURL,
-			MimeType:    ref.MimeType,
+	// Save via FileService concurrently — uploads are I/O bound and dominate
+	// wall time on image-heavy documents.
+	var g errgroup.Group
+	g.SetLimit(maxConcurrentImageSaves)
+	for i := range jobs {
+		job := &jobs[i]
+		if !job.upload {
+			continue
+		}
+		g.Go(func() error {
+			servingURL, saveErr := fileSvc.SaveBytes(ctx, job.ref.ImageData, tenantID, job.fileName, false)
+			if saveErr != nil {
+				log.Printf("WARN: failed to save image %s: %v", job.refPath, saveErr)
+				job.upload = false
+				return nil
+			}
+			job.servingURL = servingURL
+			return nil
 		})
-
-		// Replace in markdown
-		markdown = markdown[:m[4]] + servingURL + markdown[m[5]:]
 	}
+	_ = g.Wait()
+
+	// Rebuild the markdown in a single forward pass instead of re-slicing the
+	// whole document once per replaced image.
+	var out strings.Builder
+	out.Grow(len(markdown))
+	last := 0
+	for i, m := range matches {
+		job := jobs[i]
+		switch {
+		case job.drop:
+			// Remove the image reference from markdown entirely
+			out.WriteString(markdown[last:m[0]])
+			last = m[1]
+		case job.upload:
+			images = append(images, StoredImage{
+				OriginalRef: job.refPath,
+				ServingURL:  job.servingURL,
+				MimeType:    job.ref.MimeType,
+			})
+			out.WriteString(markdown[last:m[4]])
+			out.WriteString(job.servingURL)
+			last = m[5]
+		}
+	}
+	out.WriteString(markdown[last:])
 
-	return markdown, images, nil
+	return out.String(), images, nil
 }
 
 func extFromMime(mime string) string {
@@ -2,10 +2,15 @@ package docparser
 
 import (
 	"bytes"
+	"context"
 	"image"
 	"image/color"
 	"image/png"
+	"sync"
 	"testing"
+
+	"github.com/Tencent/WeKnora/internal/types"
+	"github.com/Tencent/WeKnora/internal/types/interfaces"
 )
 
 // createTestPNG generates a minimal PNG image with the given dimensions.
@@ -67,3 +72,49 @@ func TestIsIconImage(t *testing.T) {
 		})
 	}
 }
+
+// fakeFileService records SaveBytes calls; other methods are unused.
+type fakeFileService struct {
+	interfaces.FileService
+	mu    sync.Mutex
+	saved map[string][]byte
+}
+
+func (f *fakeFileService) SaveBytes(_ context.Context, data []byte, _ uint64, fileName string, _ bool) (string, error) {
+	f.mu.Lock()
+	defer f.mu.Unlock()
+	f.saved[fileName] = data
+	return "local://images/" + fileName, nil
+}
+
+func TestResolveAndStore(t *testing.T) {
+	photo := createTestPNG(200, 150)
+	icon := createTestPNG(16, 16)
+	result := &types.ReadResult{
+		MarkdownContent: "A ![p1](images/p1.png) B ![icon](images/icon.png) C " +
+			"![remote](https://example.com/x.png) D ![p2](images/p2.png) E ![missing](images/none.png)",
+		ImageRefs: []types.ImageRef{
+			{Filename: "p1.png", OriginalRef: "images/p1.png", MimeType: "image/png", ImageData: photo},
+			{Filename: "p2.png", OriginalRef: "images/p2.png", MimeType: "image/png", ImageData: photo},
+			{Filename: "icon.png", OriginalRef: "images/icon.png", MimeType: "image/png", ImageData: icon},
+		},
+	}
+	fileSvc := &fakeFileService{saved: map[string][]byte{}}
+
+	md, images, err := NewImageResolver().ResolveAndStore(context.Background(), result, fileSvc, 1)
+	if err != nil {
+		t.Fatalf("ResolveAndStore() error = %v", err)
+	}
+	if len(images) != 2 || len(fileSvc.saved) != 2 {
+		t.Fatalf("got %d images / %d saves, want 2 / 2", len(images), len(fileSvc.saved))
+	}
+
+	want := "A ![p1](" + images[0].ServingURL + ") B  C ![remote](https://example.com/x.png) D ![p2](" +
+		images[1].ServingURL + ") E ![missing](images/none.png)"
+	if md != want {
+		t.Errorf("markdown =\n%q\nwant\n%q", md, want)
+	}
+	if images[0].OriginalRef != "images/p1.png" || images[1].OriginalRef != "images/p2.png" {
+		t.Errorf("images not in document order: %+v", images)
+	}
+}
@@ -5,14 +5,18 @@ import (
 	"bytes"
 	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"io"
+	"math/rand"
 	"mime"
+	"net"
 	"net/http"
 	"path/filepath"
 	"regexp"
 	"sort"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/Tencent/WeKnora/internal/types"
@@ -21,11 +25,112 @@ import (
 )
 
 const (
-	defaultPollInterval = 3 * time.Second
+	// Status polling backs off exponentially from pollMinInterval up to
+	// pollMaxInterval, so short jobs finish after one or two requests and
+	// long jobs issue a logarithmic number of status calls.
+	pollMinInterval     = 500 * time.Millisecond
+	pollMaxInterval     = 8 * time.Second
+	pollJitter          = 250 * time.Millisecond
 	defaultCloudTimeout = 600 * time.Second
-	defaultBaseURL      = "https://mineru.net/api/v4"
+	// longPollRecheckTTL is how long a baseURL stays on client-side backoff
+	// after it was seen ignoring the wait parameter, before long-polling is
+	// probed again.
+	longPollRecheckTTL = 10 * time.Minute
+	defaultBaseURL     = "https://mineru.net/api/v4"
 )
 
+// Shared MinerU Cloud clients: reusing them keeps TCP/TLS connections alive
+// across the apply/upload/poll/download calls of every document instead of
+// paying a fresh handshake per request.
+var (
+	mineruCloudAPIClient = utils.NewSSRFSafeHTTPClient(utils.SSRFSafeHTTPClientConfig{
+		Timeout:             30 * time.Second,
+		MaxRedirects:        5,
+		MaxIdleConnsPerHost: 16,
+		ForceAttemptHTTP2:   true,
+	})
+	mineruCloudTransferClient = utils.NewSSRFSafeHTTPClient(utils.SSRFSafeHTTPClientConfig{
+		Timeout:             120 * time.Second,
+		MaxRedirects:        5,
+		MaxIdleConnsPerHost: 16,
+		ForceAttemptHTTP2:   true,
+	})
+)
+
+var (
+	// longPollWait is the server-side wait requested on status polls; a
+	// long-poll capable server holds the request until the job changes
+	// state, so completion is seen immediately with ~job/30s requests.
+	longPollWait = 30 * time.Second
+	// longPollGrace is the extra client-side time allowed on a held request
+	// beyond longPollWait before it is treated as still pending.
+	longPollGrace = 5 * time.Second
+)
+
+// mineruCloudLongPoll records which MinerU Cloud endpoints ignore the wait
+// parameter on status polls.
+var mineruCloudLongPoll = newLongPollTracker(longPollRecheckTTL)
+
+// longPollTracker remembers, per baseURL, that the status endpoint answered
+// an unchanged pending job well before the requested wait, i.e. it does not
+// support long-polling. Marks expire after ttl so the endpoint is re-probed.
+// It also remembers endpoints that were seen holding a request, the only
+// ones whose early answers are trusted to signal a state change.
+type longPollTracker struct {
+	mu          sync.Mutex
+	ttl         time.Duration
+	unsupported map[string]time.Time // baseURL -> mark expiry
+	held        map[string]struct{}
+	now         func() time.Time
+}
+
+func newLongPollTracker(ttl time.Duration) *longPollTracker {
+	return &longPollTracker{
+		ttl:         ttl,
+		unsupported: make(map[string]time.Time),
+		held:        make(map[string]struct{}),
+		now:         time.Now,
+	}
+}
+
+// supported reports whether status polls to baseURL should request a wait.
+func (t *longPollTracker) supported(baseURL string) bool {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	until, ok := t.unsupported[baseURL]
+	if !ok {
+		return true
+	}
+	if t.now().After(until) {
+		delete(t.unsupported, baseURL)
+		return true
+	}
+	return false
+}
+
+// markUnsupported switches baseURL to client-side backoff for ttl.
+func (t *longPollTracker) markUnsupported(baseURL string) {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	t.unsupported[baseURL] = t.now().Add(t.ttl)
+	delete(t.held, baseURL)
+}
+
+// markHeld records that baseURL held a status request for the wait.
+func (t *longPollTracker) markHeld(baseURL string) {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	t.held[baseURL] = struct{}{}
+}
+
+// hasHeld reports whether baseURL was ever seen holding a status request.
+func (t *longPollTracker) hasHeld(baseURL string) bool {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	_, ok := t.held[baseURL]
+	return ok
+}
+
 // MinerUCloudReader calls the MinerU Cloud API (mineru.net) to read/convert documents.
 // Flow: POST /file-urls/batch → PUT file → poll GET /extract-results/batch/{batch_id}.
 type MinerUCloudReader struct {
@@ -75,6 +180,13 @@ func (c *MinerUCloudReader) Read(ctx context.Context, req *types.ReadRequest) (*
 		fileName = "document" + ext
 	}
 
+	cacheKey := parseCacheKey("mineru_cloud", c.cacheOptions(ext), content)
+	if doc, ok := mineruParseCache.get(cacheKey); ok {
+		logger.Printf("INFO: [MinerUCloud] Cache hit for file=%s size=%d", req.FileName, len(content))
+		mdContent, imageRefs := ensureOriginalImageRef(req, doc.markdown, doc.imageRefs)
+		return &types.ReadResult{MarkdownContent: mdContent, ImageRefs: imageRefs}, nil
+	}
+
 	batchID, uploadURL, err := c.applyUploadURLs(ctx, fileName, ext)
 	if err != nil {
 		return nil, fmt.Errorf("MinerU Cloud apply upload URLs: %w", err)
@@ -89,6 +201,8 @@ func (c *MinerUCloudReader) Read(ctx context.Context, req *types.ReadRequest) (*
 		return nil, fmt.Errorf("MinerU Cloud poll: %w", err)
 	}
 
+	mineruParseCache.put(cacheKey, parsedDocument{markdown: mdContent, imageRefs: imageRefs})
+
 	mdContent, imageRefs = ensureOriginalImageRef(req, mdContent, imageRefs)
 
 	return &types.ReadResult{
@@ -97,6 +211,13 @@ func (c *MinerUCloudReader) Read(ctx context.Context, req *types.ReadRequest) (*
 	}, nil
 }
 
+// cacheOptions serializes every setting that affects the parse output; the
+// extension matters because HTML files are routed to a different model.
+func (c *MinerUCloudReader) cacheOptions(ext string) string {
+	return fmt.Sprintf("%s|%s|%v|%v|%v|%s|%s",
+		c.baseURL, c.model, c.formulaEnable, c.tableEnable, c.ocrEnable, c.language, strings.ToLower(ext))
+}
+
 // --- batch upload API ---
 
 type batchApplyResponse struct {
@@ -135,8 +256,7 @@ func (c *MinerUCloudReader) applyUploadURLs(ctx context.Context, fileName, ext s
 	httpReq.Header.Set("Authorization", "Bearer "+c.apiKey)
 	httpReq.Header.Set("Content-Type", "application/json")
 
-	client := utils.NewSSRFSafeHTTPClient(utils.SSRFSafeHTTPClientConfig{Timeout: 30 * time.Second, MaxRedirects: 5})
-	resp, err := client.Do(httpReq)
+	resp, err := mineruCloudAPIClient.Do(httpReq)
 	if err != nil {
 		return "", "", fmt.Errorf("HTTP request: %w", err)
 	}
@@ -168,11 +288,12 @@ func (c *MinerUCloudReader) uploadFile(ctx context.Context, uploadURL string, co
 		return fmt.Errorf("create PUT request: %w", err)
 	}
 
-	client := utils.NewSSRFSafeHTTPClient(utils.SSRFSafeHTTPClientConfig{Timeout: 120 * time.Second, MaxRedirects: 5})
-	resp, err := client.Do(httpReq)
+	resp, err := mineruCloudTransferClient.Do(httpReq)
 	if err != nil {
 		return fmt.Errorf("PUT upload: %w", err)
 	}
+	// Drain before closing so the connection can return to the pool
+	_, _ = io.Copy(io.Discard, resp.Body)
 	resp.Body.Close()
 
 	if resp.StatusCode >= 300 {
@@ -209,17 +330,38 @@ type extractResultItem struct {
 func (c *MinerUCloudReader) pollBatchResult(ctx context.Context, batchID string) (string, []types.ImageRef, error) {
 	deadline := time.Now().Add(defaultCloudTimeout)
 	pollCount := 0
+	attempt := 0
+	// lastStatus is the previous pending state/progress; a long-poll server
+	// may answer early only when it changes.
+	lastStatus := ""
 	headers := map[string]string{
 		"Authorization": "Bearer " + c.apiKey,
 	}
 
 	for time.Now().Before(deadline) {
+		if err := ctx.Err(); err != nil {
+			return "", nil, err
+		}
 		pollCount++
 
-		items, err := c.fetchBatchStatus(ctx, batchID, headers)
+		var wait time.Duration
+		if mineruCloudLongPoll.supported(c.baseURL) {
+			wait = longPollWait
+		}
+		started := time.Now()
+
+		items, err := c.fetchBatchStatus(ctx, batchID, headers, wait)
 		if err != nil {
+			if wait > 0 && ctx.Err() == nil && isTimeoutErr(err) {
+				// The long poll expired server- or client-side: still pending.
+				mineruCloudLongPoll.markHeld(c.baseURL)
+				continue
+			}
+			// Transient failure: restart the backoff so a network blip
+			// does not push the next polls to the maximum interval.
 			logger.Printf("WARN: [MinerUCloud] poll #%d failed: %v", pollCount, err)
-			sleepCtx(ctx, defaultPollInterval)
+			attempt = 0
+			sleepCtx(ctx, pollBackoff(attempt))
 			continue
 		}
 
@@ -227,7 +369,8 @@ func (c *MinerUCloudReader) pollBatchResult(ctx context.Context, batchID string)
 			if pollCount <= 3 || pollCount%10 == 0 {
 				logger.Printf("INFO: [MinerUCloud] poll #%d: extract_result empty, retrying", pollCount)
 			}
-			sleepCtx(ctx, defaultPollInterval)
+			sleepCtx(ctx, pollBackoff(attempt))
+			attempt++
 			continue
 		}
 
@@ -247,14 +390,71 @@ func (c *MinerUCloudReader) pollBatchResult(ctx context.Context, batchID string)
 			return c.extractDoneResult(ctx, &item)
 		}
 
-		sleepCtx(ctx, defaultPollInterval)
+		status := fmt.Sprintf("%s|%d/%d", state, item.Progress.ExtractedPages, item.Progress.TotalPages)
+		changed := status != lastStatus
+		lastStatus = status
+		if wait > 0 {
+			if time.Since(started) >= wait/2 {
+				// The server held the request: poll again right away.
+				mineruCloudLongPoll.markHeld(c.baseURL)
+				continue
+			}
+			if changed && mineruCloudLongPoll.hasHeld(c.baseURL) {
+				// A known long-poll endpoint answered a state change early.
+				continue
+			}
+			if !changed {
+				// An unchanged pending job came back early: the endpoint
+				// ignores wait.
+				logger.Printf("INFO: [MinerUCloud] %s ignored wait=%s, using client-side backoff for %s",
+					c.baseURL, wait, longPollRecheckTTL)
+				mineruCloudLongPoll.markUnsupported(c.baseURL)
+			}
+			// Otherwise the endpoint has never held a request, so an early
+			// answer is not trusted and the poll is paced by backoff.
+		}
+
+		sleepCtx(ctx, pollBackoff(attempt))
+		attempt++
 	}
 
 	return "", nil, fmt.Errorf("MinerU Cloud task timed out after %d polls", pollCount)
 }
 
-func (c *MinerUCloudReader) fetchBatchStatus(ctx context.Context, batchID string, headers map[string]string) ([]extractResultItem, error) {
+// pollBackoff returns the delay before the next status poll:
+// pollMinInterval * 2^attempt capped at pollMaxInterval, plus a small jitter.
+func pollBackoff(attempt int) time.Duration {
+	d := pollMaxInterval
+	if attempt < 8 {
+		if exp := pollMinInterval << uint(attempt); exp < pollMaxInterval {
+			d = exp
+		}
+	}
+	return d + time.Duration(rand.Int63n(int64(pollJitter)))
+}
+
+// isTimeoutErr reports whether err is a request timeout.
+func isTimeoutErr(err error) bool {
+	if errors.Is(err, context.DeadlineExceeded) {
+		return true
+	}
+	var netErr net.Error
+	return errors.As(err, &netErr) && netErr.Timeout()
+}
+
+// fetchBatchStatus fetches the batch state. A positive wait asks the server
+// to long-poll for up to that long before answering.
+func (c *MinerUCloudReader) fetchBatchStatus(ctx context.Context, batchID string, headers map[string]string, wait time.Duration) ([]extractResultItem, error) {
 	url := fmt.Sprintf("%s/extract-results/batch/%s", c.baseURL, batchID)
+	client := mineruCloudAPIClient
+	if wait > 0 {
+		url += fmt.Sprintf("?wait=%d", int(wait.Seconds()))
+		// Allow the held request to outlive the API client's 30s timeout.
+		var cancel context.CancelFunc
+		ctx, cancel = context.WithTimeout(ctx, wait+longPollGrace)
+		defer cancel()
+		client = mineruCloudTransferClient
+	}
 	httpReq, err := http.NewRequestWithContext(ctx, http.MethodGet, url, nil)
 	if err != nil {
 		return nil, err
@@ -263,7 +463,6 @@ func (c *MinerUCloudReader) fetchBatchStatus(ctx context.Context, batchID string
 		httpReq.Header.Set(k, v)
 	}
 
-	client := utils.NewSSRFSafeHTTPClient(utils.SSRFSafeHTTPClientConfig{Timeout: 30 * time.Second, MaxRedirects: 5})
 	resp, err := client.Do(httpReq)
 	if err != nil {
 		return nil, err
@@ -348,8 +547,7 @@ func downloadAndExtractZip(zipURL string) (string, []types.ImageRef, error) {
 	if safe, reason := utils.IsSSRFSafeURL(zipURL); !safe {
 		return "", nil, fmt.Errorf("zip URL blocked by SSRF check: %s", reason)
 	}
-	client := utils.NewSSRFSafeHTTPClient(utils.SSRFSafeHTTPClientConfig{Timeout: 120 * time.Second, MaxRedirects: 5})
-	resp, err := client.Get(zipURL)
+	resp, err := mineruCloudTransferClient.Get(zipURL)
 	if err != nil {
 		return "", nil, fmt.Errorf("download zip: %w", err)
 	}
@@ -485,21 +683,20 @@ func PingMinerUCloud(apiKey string) (bool, string) {
 
 	targetURL := defaultBaseURL + "/file-urls/batch"
 	payload := []byte(`{"files":[],"model_version":"pipeline"}`)
-	req, err := http.NewRequest(http.MethodPost, targetURL, bytes.NewReader(payload))
+	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+	defer cancel()
+	req, err := http.NewRequestWithContext(ctx, http.MethodPost, targetURL, bytes.NewReader(payload))
 	if err != nil {
 		return false, fmt.Sprintf("构建请求失败: %v", err)
 	}
 	req.Header.Set("Authorization", "Bearer "+apiKey)
 	req.Header.Set("Content-Type", "application/json")
 
-	client := utils.NewSSRFSafeHTTPClient(utils.SSRFSafeHTTPClientConfig{
-		Timeout:      10 * time.Second,
-		MaxRedirects: 5,
-	})
-	resp, err := client.Do(req)
+	resp, err := mineruCloudAPIClient.Do(req)
 	if err != nil {
 		return false, fmt.Sprintf("MinerU Cloud 不可达: %v", err)
 	}
+	_, _ = io.Copy(io.Discard, resp.Body)
 	resp.Body.Close()
 
 	if resp.StatusCode == 401 || resp.StatusCode == 403 {
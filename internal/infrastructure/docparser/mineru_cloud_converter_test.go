@@ -0,0 +1,304 @@
+package docparser
+
+import (
+	"context"
+	"encoding/json"
+	"fmt"
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"slices"
+	"strings"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/Tencent/WeKnora/internal/types"
+)
+
+func TestPollBackoff(t *testing.T) {
+	tests := []struct {
+		attempt int
+		base    time.Duration
+	}{
+		{attempt: 0, base: 500 * time.Millisecond},
+		{attempt: 1, base: time.Second},
+		{attempt: 2, base: 2 * time.Second},
+		{attempt: 3, base: 4 * time.Second},
+		{attempt: 4, base: 8 * time.Second},
+		{attempt: 10, base: 8 * time.Second},
+		{attempt: 100, base: 8 * time.Second},
+	}
+	for _, tt := range tests {
+		got := pollBackoff(tt.attempt)
+		if got < tt.base || got >= tt.base+pollJitter {
+			t.Errorf("pollBackoff(%d) = %v, want in [%v, %v)", tt.attempt, got, tt.base, tt.base+pollJitter)
+		}
+	}
+}
+
+// useTestCloudServer routes the shared MinerU Cloud clients to srv and
+// shortens the long-poll wait to one second for the duration of the test.
+func useTestCloudServer(t *testing.T, srv *httptest.Server) {
+	t.Helper()
+	api, transfer := mineruCloudAPIClient, mineruCloudTransferClient
+	wait, grace := longPollWait, longPollGrace
+	mineruCloudAPIClient, mineruCloudTransferClient = srv.Client(), srv.Client()
+	longPollWait, longPollGrace = time.Second, 200*time.Millisecond
+	t.Cleanup(func() {
+		mineruCloudAPIClient, mineruCloudTransferClient = api, transfer
+		longPollWait, longPollGrace = wait, grace
+	})
+}
+
+// statusServer serves the batch status endpoint through handle, which gets
+// the 1-based call number, and records the wait parameter of every call.
+type statusServer struct {
+	*httptest.Server
+	mu    sync.Mutex
+	waits []string
+}
+
+func newStatusServer(t *testing.T, handle func(n int, w http.ResponseWriter, r *http.Request)) *statusServer {
+	t.Helper()
+	s := &statusServer{}
+	s.Server = httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		s.mu.Lock()
+		s.waits = append(s.waits, r.URL.Query().Get("wait"))
+		n := len(s.waits)
+		s.mu.Unlock()
+		handle(n, w, r)
+	}))
+	t.Cleanup(s.Close)
+	useTestCloudServer(t, s.Server)
+	return s
+}
+
+func (s *statusServer) waitParams() []string {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	return append([]string(nil), s.waits...)
+}
+
+func writeState(w http.ResponseWriter, state, markdown string) {
+	fmt.Fprintf(w, `{"code":0,"data":{"extract_result":{"state":%q,"markdown":%q}}}`, state, markdown)
+}
+
+func pollTestBatch(t *testing.T, baseURL string) string {
+	t.Helper()
+	c := &MinerUCloudReader{apiKey: "k", baseURL: baseURL}
+	md, _, err := c.pollBatchResult(context.Background(), "batch-1")
+	if err != nil {
+		t.Fatalf("pollBatchResult: %v", err)
+	}
+	return md
+}
+
+func TestPollBatchResultLongPolls(t *testing.T) {
+	srv := newStatusServer(t, func(n int, w http.ResponseWriter, r *http.Request) {
+		switch n {
+		case 1:
+			writeState(w, "pending", "")
+		case 2:
+			// Held by the server, answered unchanged near the wait limit.
+			time.Sleep(600 * time.Millisecond)
+			writeState(w, "pending", "")
+		case 3:
+			// Early answer on a state change.
+			writeState(w, "running", "")
+		default:
+			writeState(w, "done", "# ok")
+		}
+	})
+
+	if md := pollTestBatch(t, srv.URL); md != "# ok" {
+		t.Errorf("markdown = %q, want %q", md, "# ok")
+	}
+	if got := srv.waitParams(); !slices.Equal(got, []string{"1", "1", "1", "1"}) {
+		t.Errorf("wait params = %q, want wait=1 on every poll", got)
+	}
+	if !mineruCloudLongPoll.supported(srv.URL) {
+		t.Error("held and state-change answers must not disable long-polling")
+	}
+	if !mineruCloudLongPoll.hasHeld(srv.URL) {
+		t.Error("endpoint that held a request should be recorded")
+	}
+}
+
+func TestPollBatchResultPacesEarlyAnswersFromUnprovenEndpoints(t *testing.T) {
+	srv := newStatusServer(t, func(n int, w http.ResponseWriter, r *http.Request) {
+		// The server ignores wait but reports new progress on every call.
+		if n < 3 {
+			fmt.Fprintf(w, `{"code":0,"data":{"extract_result":{"state":"running","extract_progress":{"extracted_pages":%d,"total_pages":9}}}}`, n)
+			return
+		}
+		writeState(w, "done", "# ok")
+	})
+
+	started := time.Now()
+	if md := pollTestBatch(t, srv.URL); md != "# ok" {
+		t.Errorf("markdown = %q, want %q", md, "# ok")
+	}
+	// Two early answers: pollBackoff(0) + pollBackoff(1).
+	if elapsed, want := time.Since(started), 3*pollMinInterval; elapsed < want {
+		t.Errorf("early answers were polled back to back (elapsed %v, want >= %v)", elapsed, want)
+	}
+	if got := srv.waitParams(); !slices.Equal(got, []string{"1", "1", "1"}) {
+		t.Errorf("wait params = %q, want wait=1 on every poll", got)
+	}
+	if mineruCloudLongPoll.hasHeld(srv.URL) {
+		t.Error("endpoint that never held a request must not be trusted")
+	}
+}
+
+func TestPollBatchResultTreatsLongPollTimeoutAsPending(t *testing.T) {
+	srv := newStatusServer(t, func(n int, w http.ResponseWriter, r *http.Request) {
+		if n == 1 {
+			// Hold past the client's wait+grace deadline.
+			select {
+			case <-r.Context().Done():
+			case <-time.After(5 * time.Second):
+			}
+			return
+		}
+		writeState(w, "done", "# late")
+	})
+
+	if md := pollTestBatch(t, srv.URL); md != "# late" {
+		t.Errorf("markdown = %q, want %q", md, "# late")
+	}
+	if got := srv.waitParams(); !slices.Equal(got, []string{"1", "1"}) {
+		t.Errorf("wait params = %q, want two long polls", got)
+	}
+	if !mineruCloudLongPoll.supported(srv.URL) {
+		t.Error("a long-poll timeout must not disable long-polling")
+	}
+}
+
+func TestPollBatchResultFallsBackToBackoff(t *testing.T) {
+	srv := newStatusServer(t, func(n int, w http.ResponseWriter, r *http.Request) {
+		// The server ignores wait and answers immediately.
+		if n < 3 {
+			writeState(w, "running", "")
+			return
+		}
+		writeState(w, "done", "# ok")
+	})
+
+	started := time.Now()
+	if md := pollTestBatch(t, srv.URL); md != "# ok" {
+		t.Errorf("markdown = %q, want %q", md, "# ok")
+	}
+	if got := srv.waitParams(); !slices.Equal(got, []string{"1", "1", ""}) {
+		t.Errorf("wait params = %q, want two long polls then a plain poll", got)
+	}
+	if elapsed := time.Since(started); elapsed < pollMinInterval {
+		t.Errorf("fallback poll was not delayed by backoff (elapsed %v)", elapsed)
+	}
+	if mineruCloudLongPoll.supported(srv.URL) {
+		t.Error("endpoint ignoring wait should be marked unsupported")
+	}
+	if !mineruCloudLongPoll.supported(srv.URL + "/other") {
+		t.Error("other endpoints must keep long-polling")
+	}
+}
+
+func TestLongPollTrackerRechecksAfterTTL(t *testing.T) {
+	now := time.Unix(0, 0)
+	tr := newLongPollTracker(time.Minute)
+	tr.now = func() time.Time { return now }
+
+	tr.markUnsupported("https://a")
+	if tr.supported("https://a") {
+		t.Error("marked endpoint reported as supported")
+	}
+	if !tr.supported("https://b") {
+		t.Error("unmarked endpoint reported as unsupported")
+	}
+	now = now.Add(time.Minute + time.Second)
+	if !tr.supported("https://a") {
+		t.Error("mark did not expire after ttl")
+	}
+
+	tr.markHeld("https://a")
+	tr.markUnsupported("https://a")
+	if tr.hasHeld("https://a") {
+		t.Error("marking unsupported must forget that the endpoint held requests")
+	}
+}
+
+// newCloudAPIServer fakes the apply/upload/status flow. Each document gets
+// its file name as batch ID; names starting with "bad" are rejected at
+// apply time.
+func newCloudAPIServer(t *testing.T) *httptest.Server {
+	t.Helper()
+	var srv *httptest.Server
+	srv = httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		switch {
+		case r.Method == http.MethodPost && r.URL.Path == "/file-urls/batch":
+			var payload struct {
+				Files []struct {
+					Name string `json:"name"`
+				} `json:"files"`
+			}
+			if err := json.NewDecoder(r.Body).Decode(&payload); err != nil || len(payload.Files) != 1 {
+				http.Error(w, "bad payload", http.StatusBadRequest)
+				return
+			}
+			name := payload.Files[0].Name
+			if strings.HasPrefix(name, "bad") {
+				fmt.Fprint(w, `{"code":1,"msg":"quota exceeded"}`)
+				return
+			}
+			fmt.Fprintf(w, `{"code":0,"data":{"batch_id":%q,"file_urls":[%q]}}`, name, srv.URL+"/upload/"+name)
+		case r.Method == http.MethodPut && strings.HasPrefix(r.URL.Path, "/upload/"):
+			_, _ = io.Copy(io.Discard, r.Body)
+		case r.Method == http.MethodGet && strings.HasPrefix(r.URL.Path, "/extract-results/batch/"):
+			// Keep several documents in flight at once.
+			time.Sleep(50 * time.Millisecond)
+			writeState(w, "done", "# "+strings.TrimPrefix(r.URL.Path, "/extract-results/batch/"))
+		default:
+			http.NotFound(w, r)
+		}
+	}))
+	t.Cleanup(srv.Close)
+	useTestCloudServer(t, srv)
+	return srv
+}
+
+func TestMinerUCloudReaderConcurrentReads(t *testing.T) {
+	srv := newCloudAPIServer(t)
+	c := &MinerUCloudReader{apiKey: "k", baseURL: srv.URL, model: "pipeline"}
+
+	names := []string{"a.pdf", "bad.pdf", "b.pdf", "c.pdf", "d.pdf"}
+	results := make([]*types.ReadResult, len(names))
+	errs := make([]error, len(names))
+	var wg sync.WaitGroup
+	for i, name := range names {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			results[i], errs[i] = c.Read(context.Background(), &types.ReadRequest{
+				FileName:    name,
+				FileContent: []byte("content of " + name),
+			})
+		}()
+	}
+	wg.Wait()
+
+	for i, name := range names {
+		if strings.HasPrefix(name, "bad") {
+			if errs[i] == nil || !strings.Contains(errs[i].Error(), "quota exceeded") {
+				t.Errorf("%s: err = %v, want apply failure", name, errs[i])
+			}
+			continue
+		}
+		if errs[i] != nil {
+			t.Errorf("%s: unexpected error %v", name, errs[i])
+			continue
+		}
+		if want := "# " + name; results[i].MarkdownContent != want {
+			t.Errorf("%s: markdown = %q, want %q", name, results[i].MarkdownContent, want)
+		}
+	}
+}
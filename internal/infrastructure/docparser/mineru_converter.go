@@ -12,17 +12,37 @@ import (
 	"net/http"
 	"path/filepath"
 	"regexp"
+	"runtime"
 	"strings"
 	"time"
 
 	htmltomd "github.com/JohannesKaufmann/html-to-markdown/v2"
 	"github.com/Tencent/WeKnora/internal/types"
+	"golang.org/x/sync/errgroup"
 )
 
 const mineruTimeout = 1000 * time.Second // large docs can take a while
 
+// mineruHTTPClient is shared across readers so keep-alive connections to the
+// MinerU endpoint are reused between documents.
+var mineruHTTPClient = &http.Client{Timeout: mineruTimeout}
+
 var b64DataURIPattern = regexp.MustCompile(`^data:image/(\w+);base64,(.+)$`)
 
+// mdImageTargetPattern captures the target path of markdown image references,
+// ignoring an optional title after the path.
+var mdImageTargetPattern = regexp.MustCompile(`!\[[^\]]*\]\(\s*([^)\s]+)`)
+
+// referencedImagePaths collects every markdown image target in a single pass,
+// so per-image presence checks are O(1) instead of rescanning the document.
+func referencedImagePaths(mdContent string) map[string]struct{} {
+	refs := make(map[string]struct{})
+	for _, m := range mdImageTargetPattern.FindAllStringSubmatch(mdContent, -1) {
+		refs[m[1]] = struct{}{}
+	}
+	return refs
+}
+
 // MinerUReader calls a self-hosted MinerU API to read/convert documents.
 type MinerUReader struct {
 	endpoint      string
@@ -56,6 +76,13 @@ func (c *MinerUReader) Read(ctx context.Context, req *types.ReadRequest) (*types
 		return &types.ReadResult{Error: "no file content provided"}, nil
 	}
 
+	cacheKey := parseCacheKey("mineru", c.cacheOptions(), content)
+	if doc, ok := mineruParseCache.get(cacheKey); ok {
+		logger.Printf("INFO: [MinerU] Cache hit for file=%s size=%d", req.FileName, len(content))
+		mdContent, imageRefs := ensureOriginalImageRef(req, doc.markdown, doc.imageRefs)
+		return &types.ReadResult{MarkdownContent: mdContent, ImageRefs: imageRefs}, nil
+	}
+
 	logger.Printf("INFO: [MinerU] Parsing file=%s size=%d via %s", req.FileName, len(content), c.endpoint)
 
 	mdContent, imagesB64, err := c.callFileParse(ctx, content)
@@ -63,12 +90,15 @@ func (c *MinerUReader) Read(ctx context.Context, req *types.ReadRequest) (*types
 		return nil, fmt.Errorf("MinerU file_parse: %w", err)
 	}
 
-	// HTML -> Markdown conversion (equivalent to Python markdownify)
-	mdContent = htmlToMarkdown(mdContent)
+	// HTML -> Markdown conversion (equivalent to Python markdownify),
+	// limited to the HTML fragments MinerU embeds in its markdown
+	mdContent = convertEmbeddedHTML(mdContent)
 
 	// Process images: decode base64, build ImageRef list, replace refs in markdown
 	imageRefs, mdContent := c.processImages(mdContent, imagesB64)
 
+	mineruParseCache.put(cacheKey, parsedDocument{markdown: mdContent, imageRefs: imageRefs})
+
 	mdContent, imageRefs = ensureOriginalImageRef(req, mdContent, imageRefs)
 
 	logger.Printf("INFO: [MinerU] Parsed successfully, markdown=%d chars, images=%d", len(mdContent), len(imageRefs))
@@ -79,6 +109,12 @@ func (c *MinerUReader) Read(ctx context.Context, req *types.ReadRequest) (*types
 	}, nil
 }
 
+// cacheOptions serializes every setting that affects the parse output.
+func (c *MinerUReader) cacheOptions() string {
+	return fmt.Sprintf("%s|%s|%v|%v|%v|%s",
+		c.endpoint, c.backend, c.formulaEnable, c.tableEnable, c.ocrEnable, c.language)
+}
+
 // mineruFileParseResponse mirrors the relevant fields from the MinerU API response.
 type mineruFileParseResponse struct {
 	Results struct {
@@ -94,8 +130,10 @@ type mineruFileParseResponse struct {
 }
 
 func (c *MinerUReader) callFileParse(ctx context.Context, content []byte) (string, map[string]string, error) {
-	var body bytes.Buffer
-	writer := multipart.NewWriter(&body)
+	// Only the form fields and part headers are buffered; the file bytes are
+	// streamed from content so large documents are not copied into the body.
+	var head bytes.Buffer
+	writer := multipart.NewWriter(&head)
 
 	// Form fields
 	fields := map[string]string{
@@ -122,24 +160,29 @@ func (c *MinerUReader) callFileParse(ctx context.Context, content []byte) (strin
 		_ = writer.WriteField(k, v)
 	}
 
-	// File part
-	part, err := writer.CreateFormFile("files", "document")
-	if err != nil {
+	// File part: headers go into head, the closing boundary into tail.
+	if _, err := writer.CreateFormFile("files", "document"); err != nil {
 		return "", nil, fmt.Errorf("create form file: %w", err)
 	}
-	if _, err := part.Write(content); err != nil {
-		return "", nil, fmt.Errorf("write file content: %w", err)
-	}
+	prefix := bytes.Clone(head.Bytes())
+	head.Reset()
 	writer.Close()
+	suffix := head.Bytes()
 
-	httpReq, err := http.NewRequestWithContext(ctx, http.MethodPost, c.endpoint+"/file_parse", &body)
+	newBody := func() io.ReadCloser {
+		return io.NopCloser(io.MultiReader(bytes.NewReader(prefix), bytes.NewReader(content), bytes.NewReader(suffix)))
+	}
+	httpReq, err := http.NewRequestWithContext(ctx, http.MethodPost, c.endpoint+"/file_parse", newBody())
 	if err != nil {
 		return "", nil, fmt.Errorf("create request: %w", err)
 	}
+	// A MultiReader is not one of the body types net/http can size or rewind,
+	// so set the length and a replayable body explicitly.
+	httpReq.ContentLength = int64(len(prefix) + len(content) + len(suffix))
+	httpReq.GetBody = func() (io.ReadCloser, error) { return newBody(), nil }
 	httpReq.Header.Set("Content-Type", writer.FormDataContentType())
 
-	client := &http.Client{Timeout: mineruTimeout}
-	resp, err := client.Do(httpReq)
+	resp, err := mineruHTTPClient.Do(httpReq)
 	if err != nil {
 		return "", nil, fmt.Errorf("HTTP request: %w", err)
 	}
@@ -193,54 +236,87 @@ func (c *MinerUReader) callFileParse(ctx context.Context, content []byte) (strin
 
 // processImages decodes base64 images from MinerU response and returns ImageRef list.
 // It also replaces image references in the markdown content.
+// Decoding is CPU bound, so referenced images are decoded in parallel across
+// GOMAXPROCS goroutines.
 func (c *MinerUReader) processImages(mdContent string, imagesB64 map[string]string) ([]types.ImageRef, string) {
-	var refs []types.ImageRef
+	if len(imagesB64) == 0 {
+		return nil, mdContent
+	}
+	referenced := referencedImagePaths(mdContent)
 
+	type pendingImage struct {
+		ipath  string
+		b64Str string
+		ref    types.ImageRef
+		ok     bool
+	}
+	pending := make([]pendingImage, 0, len(imagesB64))
 	for ipath, b64Str := range imagesB64 {
-		originalRef := "images/" + ipath
-		if !strings.Contains(mdContent, originalRef) {
+		if _, ok := referenced["images/"+ipath]; !ok {
 			continue
 		}
+		pending = append(pending, pendingImage{ipath: ipath, b64Str: b64Str})
+	}
 
-		var imgBytes []byte
-		var ext string
-
-		if m := b64DataURIPattern.FindStringSubmatch(b64Str); len(m) == 3 {
-			ext = m[1]
-			decoded, err := base64.StdEncoding.DecodeString(m[2])
-			if err != nil {
-				logger.Printf("WARN: [MinerU] Failed to decode base64 image %s: %v", ipath, err)
-				continue
-			}
-			imgBytes = decoded
-		} else {
-			// raw base64 without data URI prefix
-			decoded, err := base64.StdEncoding.DecodeString(b64Str)
-			if err != nil {
-				logger.Printf("WARN: [MinerU] Failed to decode raw base64 image %s: %v", ipath, err)
-				continue
-			}
-			imgBytes = decoded
-			ext = strings.TrimPrefix(filepath.Ext(ipath), ".")
-			if ext == "" {
-				ext = "png"
-			}
+	var g errgroup.Group
+	g.SetLimit(runtime.GOMAXPROCS(0))
+	for i := range pending {
+		p := &pending[i]
+		g.Go(func() error {
+			p.ref, p.ok = decodeMinerUImage(p.ipath, p.b64Str)
+			return nil
+		})
+	}
+	_ = g.Wait()
+
+	refs := make([]types.ImageRef, 0, len(pending))
+	for _, p := range pending {
+		if p.ok {
+			refs = append(refs, p.ref)
 		}
+	}
+	return refs, mdContent
+}
 
-		mimeType := mime.TypeByExtension("." + ext)
-		if mimeType == "" {
-			mimeType = "image/png"
+// decodeMinerUImage decodes one MinerU image entry, given either as a data URI
+// or as raw base64. It reports false (after logging) when decoding fails.
+func decodeMinerUImage(ipath, b64Str string) (types.ImageRef, bool) {
+	var imgBytes []byte
+	var ext string
+
+	if m := b64DataURIPattern.FindStringSubmatch(b64Str); len(m) == 3 {
+		ext = m[1]
+		decoded, err := base64.StdEncoding.DecodeString(m[2])
+		if err != nil {
+			logger.Printf("WARN: [MinerU] Failed to decode base64 image %s: %v", ipath, err)
+			return types.ImageRef{}, false
 		}
+		imgBytes = decoded
+	} else {
+		// raw base64 without data URI prefix
+		decoded, err := base64.StdEncoding.DecodeString(b64Str)
+		if err != nil {
+			logger.Printf("WARN: [MinerU] Failed to decode raw base64 image %s: %v", ipath, err)
+			return types.ImageRef{}, false
+		}
+		imgBytes = decoded
+		ext = strings.TrimPrefix(filepath.Ext(ipath), ".")
+		if ext == "" {
+			ext = "png"
+		}
+	}
 
-		refs = append(refs, types.ImageRef{
-			Filename:    ipath,
-			OriginalRef: originalRef,
-			MimeType:    mimeType,
-			ImageData:   imgBytes,
-		})
+	mimeType := mime.TypeByExtension("." + ext)
+	if mimeType == "" {
+		mimeType = "image/png"
 	}
 
-	return refs, mdContent
+	return types.ImageRef{
+		Filename:    ipath,
+		OriginalRef: "images/" + ipath,
+		MimeType:    mimeType,
+		ImageData:   imgBytes,
+	}, true
 }
 
 // logMinerUResponseStructure logs the structure of the MinerU API response.
@@ -266,10 +342,64 @@ func PingMinerU(endpoint string) (bool, string) {
 	return true, ""
 }
 
-// htmlToMarkdown converts HTML content to markdown.
-// Falls back to the original content if conversion fails.
+var (
+	// htmlTagPattern detects any HTML start or end tag.
+	htmlTagPattern = regexp.MustCompile(`</?[A-Za-z][^>]*>`)
+	// htmlTablePattern matches one HTML table up to the first closing tag;
+	// spans that contain a nested <table are rejected by convertEmbeddedHTML.
+	htmlTablePattern = regexp.MustCompile(`(?is)<table\b.*?</table>`)
+	// htmlTableOpenPattern finds <table start tags inside a matched span.
+	htmlTableOpenPattern = regexp.MustCompile(`(?i)<table\b`)
+)
+
+// convertEmbeddedHTML converts the HTML embedded in MinerU markdown output.
+// MinerU emits plain markdown except for <table> blocks, so:
+//   - content without HTML tags is returned unchanged;
+//   - when the only HTML is flat (non-nested) tables, just the table spans
+//     are converted;
+//   - anything else (other tags, nested tables) falls back to converting the
+//     whole document.
+func convertEmbeddedHTML(content string) string {
+	if !htmlTagPattern.MatchString(content) {
+		return content
+	}
+
+	spans := htmlTablePattern.FindAllStringIndex(content, -1)
+	if len(spans) == 0 {
+		return htmlToMarkdown(content)
+	}
+	last := 0
+	for _, span := range spans {
+		if htmlTagPattern.MatchString(content[last:span[0]]) ||
+			len(htmlTableOpenPattern.FindAllStringIndex(content[span[0]:span[1]], 2)) > 1 {
+			return htmlToMarkdown(content)
+		}
+		last = span[1]
+	}
+	if htmlTagPattern.MatchString(content[last:]) {
+		return htmlToMarkdown(content)
+	}
+
+	var b strings.Builder
+	b.Grow(len(content))
+	last = 0
+	for _, span := range spans {
+		b.WriteString(content[last:span[0]])
+		b.WriteString(htmlToMarkdown(content[span[0]:span[1]]))
+		last = span[1]
+	}
+	b.WriteString(content[last:])
+	return b.String()
+}
+
+// convertHTMLString is the HTML to markdown converter; tests replace it to
+// observe which fragments are converted.
+var convertHTMLString = func(content string) (string, error) {
+	return htmltomd.ConvertString(content)
+}
+
 func htmlToMarkdown(content string) string {
-	md, err := htmltomd.ConvertString(content)
+	md, err := convertHTMLString(content)
 	if err != nil {
 		logger.Printf("WARN: [MinerU] html-to-markdown conversion failed, using raw content: %v", err)
 		return content
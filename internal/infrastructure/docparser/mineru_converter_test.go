@@ -0,0 +1,305 @@
+package docparser
+
+import (
+	"bytes"
+	"context"
+	"encoding/base64"
+	"fmt"
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+)
+
+func TestReferencedImagePaths(t *testing.T) {
+	md := "# Title\n\n![fig 1](images/a.jpg)\ntext images/b.jpg in prose\n" +
+		"![](images/c.png \"caption\")\n![x]( images/d.png )"
+
+	refs := referencedImagePaths(md)
+
+	for _, want := range []string{"images/a.jpg", "images/c.png", "images/d.png"} {
+		if _, ok := refs[want]; !ok {
+			t.Errorf("expected %s to be referenced", want)
+		}
+	}
+	if _, ok := refs["images/b.jpg"]; ok {
+		t.Error("plain-text mention should not count as an image reference")
+	}
+	if len(refs) != 3 {
+		t.Errorf("got %d refs, want 3: %v", len(refs), refs)
+	}
+}
+
+func TestConvertEmbeddedHTMLLeavesPlainMarkdown(t *testing.T) {
+	md := "# Title\n\nSome *emphasis* and a_b_c.\n\n![](images/a.jpg)\n"
+	if got := convertEmbeddedHTML(md); got != md {
+		t.Errorf("plain markdown was modified:\n%q", got)
+	}
+}
+
+func TestConvertEmbeddedHTMLOnlyTouchesTables(t *testing.T) {
+	head := "# Report\n\nRevenue *grew* a_b_c.\n\n"
+	tail := "\n\nSee ![](images/a.jpg) for details.\n"
+	md := head + "<table><tr><td>Q1</td><td>10</td></tr></table>" + tail
+
+	got := convertEmbeddedHTML(md)
+	if !strings.HasPrefix(got, head) || !strings.HasSuffix(got, tail) {
+		t.Errorf("text around the table was modified:\n%q", got)
+	}
+	if strings.Contains(got, "<table") || !strings.Contains(got, "Q1") {
+		t.Errorf("table was not converted:\n%q", got)
+	}
+}
+
+// stubHTMLConverter records every fragment passed to the HTML converter and
+// replaces it with a fixed marker.
+func stubHTMLConverter(t *testing.T) *[]string {
+	t.Helper()
+	var calls []string
+	orig := convertHTMLString
+	convertHTMLString = func(content string) (string, error) {
+		calls = append(calls, content)
+		return "<converted>", nil
+	}
+	t.Cleanup(func() { convertHTMLString = orig })
+	return &calls
+}
+
+func TestConvertEmbeddedHTMLConvertsWholeDocumentForOtherTags(t *testing.T) {
+	for _, md := range []string{
+		"Some <b>bold</b> text",
+		"See <a href=\"https://example.com\">the docs</a>.",
+		"<ul><li>one</li><li>two</li></ul>",
+		"An <em>emphasised</em> word",
+		"<h1>Title</h1>\n\nbody",
+		"Run <code>make</code> first",
+		"<b>x</b>\n\n<table><tr><td>Q1</td></tr></table>",
+		"<table><tr><td>Q1</td></tr></table>\n\n<code>y</code>",
+	} {
+		calls := stubHTMLConverter(t)
+		got := convertEmbeddedHTML(md)
+		if got != "<converted>" || len(*calls) != 1 || (*calls)[0] != md {
+			t.Errorf("%q: want whole-document conversion, got %q (calls %q)", md, got, *calls)
+		}
+	}
+}
+
+func TestConvertEmbeddedHTMLConvertsWholeDocumentForNestedTables(t *testing.T) {
+	md := "a <table><tr><td><table><tr><td>x</td></tr></table></td></tr></table> b"
+	calls := stubHTMLConverter(t)
+
+	got := convertEmbeddedHTML(md)
+	if got != "<converted>" || len(*calls) != 1 || (*calls)[0] != md {
+		t.Errorf("want whole-document conversion, got %q (calls %q)", got, *calls)
+	}
+}
+
+func TestConvertEmbeddedHTMLConvertsEachFlatTable(t *testing.T) {
+	t1 := "<table><tr><td>1</td></tr></table>"
+	t2 := "<TABLE><tr><td>2</td></tr></TABLE>"
+	md := "intro\n\n" + t1 + "\n\nmiddle *text*\n\n" + t2 + "\n\nend"
+	calls := stubHTMLConverter(t)
+
+	got := convertEmbeddedHTML(md)
+	want := "intro\n\n<converted>\n\nmiddle *text*\n\n<converted>\n\nend"
+	if got != want {
+		t.Errorf("got %q, want %q", got, want)
+	}
+	if len(*calls) != 2 || (*calls)[0] != t1 || (*calls)[1] != t2 {
+		t.Errorf("unexpected converter calls: %q", *calls)
+	}
+}
+
+// replayRecorder captures the bytes produced by each request's GetBody so
+// tests can check that the body is replayable and matches what was sent.
+type replayRecorder struct {
+	t        *testing.T
+	base     http.RoundTripper
+	replayed []byte
+}
+
+func (rt *replayRecorder) RoundTrip(req *http.Request) (*http.Response, error) {
+	if req.GetBody == nil {
+		rt.t.Error("request body is not replayable: GetBody is nil")
+	} else {
+		body, err := req.GetBody()
+		if err != nil {
+			rt.t.Fatalf("GetBody: %v", err)
+		}
+		rt.replayed, _ = io.ReadAll(body)
+		body.Close()
+	}
+	return rt.base.RoundTrip(req)
+}
+
+func TestCallFileParseSendsMultipartForm(t *testing.T) {
+	// Binary content with CRLFs and boundary-like dashes must survive intact.
+	content := []byte("%PDF-1.7\r\n--boundary\r\n\x00\xff\r\n--\r\n")
+
+	var received []byte
+	var contentLength int64
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.URL.Path != "/file_parse" {
+			http.NotFound(w, r)
+			return
+		}
+		var err error
+		if received, err = io.ReadAll(r.Body); err != nil {
+			t.Errorf("read body: %v", err)
+		}
+		contentLength = r.ContentLength
+		r.Body = io.NopCloser(bytes.NewReader(received))
+		if err := r.ParseMultipartForm(1 << 20); err != nil {
+			t.Errorf("ParseMultipartForm: %v", err)
+			http.Error(w, err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		want := map[string]string{
+			"return_md":           "true",
+			"return_images":       "true",
+			"table_enable":        "true",
+			"formula_enable":      "false",
+			"parse_method":        "txt",
+			"start_page_id":       "0",
+			"end_page_id":         "99999",
+			"backend":             "pipeline",
+			"response_format_zip": "false",
+			"return_middle_json":  "false",
+			"return_model_output": "false",
+			"return_content_list": "true",
+			"lang_list":           "en",
+		}
+		for k, v := range want {
+			if got := r.MultipartForm.Value[k]; len(got) != 1 || got[0] != v {
+				t.Errorf("field %s = %q, want %q", k, got, v)
+			}
+		}
+		if len(r.MultipartForm.Value) != len(want) {
+			t.Errorf("got %d form fields, want %d", len(r.MultipartForm.Value), len(want))
+		}
+
+		files := r.MultipartForm.File["files"]
+		if len(files) != 1 {
+			t.Fatalf("got %d files parts, want 1", len(files))
+		}
+		if files[0].Filename != "document" {
+			t.Errorf("filename = %q, want document", files[0].Filename)
+		}
+		f, _ := files[0].Open()
+		defer f.Close()
+		if got, _ := io.ReadAll(f); !bytes.Equal(got, content) {
+			t.Errorf("file part = %q, want %q", got, content)
+		}
+
+		w.Write([]byte(`{"results":{"document":{"md_content":"# ok"}}}`))
+	}))
+	defer srv.Close()
+
+	recorder := &replayRecorder{t: t, base: srv.Client().Transport}
+	orig := mineruHTTPClient
+	mineruHTTPClient = &http.Client{Transport: recorder}
+	t.Cleanup(func() { mineruHTTPClient = orig })
+
+	r := NewMinerUReader(map[string]string{
+		"mineru_endpoint":       srv.URL + "/",
+		"mineru_enable_formula": "false",
+		"mineru_enable_ocr":     "false",
+		"mineru_language":       "en",
+	})
+	md, _, err := r.callFileParse(context.Background(), content)
+	if err != nil {
+		t.Fatalf("callFileParse: %v", err)
+	}
+	if md != "# ok" {
+		t.Errorf("markdown = %q", md)
+	}
+	if contentLength != int64(len(received)) {
+		t.Errorf("ContentLength = %d, but %d bytes were received", contentLength, len(received))
+	}
+	if !bytes.Equal(recorder.replayed, received) {
+		t.Error("GetBody replayed a different body than the one sent")
+	}
+}
+
+func TestProcessImages(t *testing.T) {
+	pixel := []byte("\x89PNG\r\n\x1a\nfake")
+	raw := base64.StdEncoding.EncodeToString(pixel)
+
+	tests := []struct {
+		name     string
+		ipath    string
+		b64      string
+		md       string
+		wantMIME string // empty means the image is skipped
+	}{
+		{"data URI", "a.jpg", "data:image/jpeg;base64," + raw, "![](images/a.jpg)", "image/jpeg"},
+		{"raw base64", "b.png", raw, "![](images/b.png)", "image/png"},
+		{"raw base64 uses path extension", "c.gif", raw, "![](images/c.gif)", "image/gif"},
+		{"raw base64 without extension", "d", raw, "![](images/d)", "image/png"},
+		{"unknown extension falls back to png", "e.unknownext", raw, "![](images/e.unknownext)", "image/png"},
+		{"unknown data URI subtype falls back to png", "f.bin", "data:image/unknownext;base64," + raw, "![](images/f.bin)", "image/png"},
+		{"undecodable data URI", "g.png", "data:image/png;base64,!!!", "![](images/g.png)", ""},
+		{"undecodable raw base64", "h.png", "not base64!", "![](images/h.png)", ""},
+		{"unreferenced", "i.png", raw, "text images/i.png only", ""},
+	}
+	r := &MinerUReader{}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			refs, md := r.processImages(tt.md, map[string]string{tt.ipath: tt.b64})
+			if md != tt.md {
+				t.Errorf("markdown changed: %q", md)
+			}
+			if tt.wantMIME == "" {
+				if len(refs) != 0 {
+					t.Errorf("expected image to be skipped, got %+v", refs)
+				}
+				return
+			}
+			if len(refs) != 1 {
+				t.Fatalf("got %d refs, want 1", len(refs))
+			}
+			ref := refs[0]
+			if ref.Filename != tt.ipath || ref.OriginalRef != "images/"+tt.ipath {
+				t.Errorf("ref names = %q, %q", ref.Filename, ref.OriginalRef)
+			}
+			if ref.MimeType != tt.wantMIME {
+				t.Errorf("MimeType = %q, want %q", ref.MimeType, tt.wantMIME)
+			}
+			if !bytes.Equal(ref.ImageData, pixel) {
+				t.Errorf("ImageData = %q, want %q", ref.ImageData, pixel)
+			}
+		})
+	}
+}
+
+func TestProcessImagesDecodesManyInParallel(t *testing.T) {
+	raw := base64.StdEncoding.EncodeToString([]byte("img"))
+	images := make(map[string]string)
+	var md strings.Builder
+	for i := 0; i < 64; i++ {
+		name := fmt.Sprintf("%d.png", i)
+		images[name] = raw
+		if i%2 == 0 {
+			fmt.Fprintf(&md, "![](images/%s)\n", name)
+		}
+	}
+	images["bad.png"] = "!!!"
+	md.WriteString("![](images/bad.png)\n")
+
+	refs, _ := (&MinerUReader{}).processImages(md.String(), images)
+	if len(refs) != 32 {
+		t.Fatalf("got %d refs, want 32", len(refs))
+	}
+	seen := make(map[string]bool)
+	for _, ref := range refs {
+		if seen[ref.Filename] {
+			t.Errorf("duplicate ref %s", ref.Filename)
+		}
+		seen[ref.Filename] = true
+		if string(ref.ImageData) != "img" {
+			t.Errorf("%s: ImageData = %q", ref.Filename, ref.ImageData)
+		}
+	}
+}
@@ -0,0 +1,118 @@
+package docparser
+
+import (
+	"container/list"
+	"crypto/sha256"
+	"encoding/hex"
+	"slices"
+	"sync"
+
+	"github.com/Tencent/WeKnora/internal/types"
+)
+
+const (
+	// parseCacheSize bounds the number of cached parse results.
+	parseCacheSize = 32
+	// parseCacheMaxBytes bounds the total markdown and decoded image bytes
+	// held by the cache; a single document larger than this is not cached.
+	parseCacheMaxBytes = 256 << 20
+)
+
+// parsedDocument is the engine output for one document, before any
+// request-specific post-processing (e.g. ensureOriginalImageRef).
+type parsedDocument struct {
+	markdown  string
+	imageRefs []types.ImageRef
+}
+
+// parseCache is a small content-addressed LRU shared by the remote MinerU
+// readers, so re-ingesting identical bytes (re-index / re-chunk flows)
+// skips the remote parse entirely.
+type parseCache struct {
+	mu       sync.Mutex
+	size     int
+	maxBytes int64
+	bytes    int64      // total footprint of all entries
+	order    *list.List // front = most recently used
+	entries  map[string]*list.Element
+}
+
+type parseCacheEntry struct {
+	key   string
+	doc   parsedDocument
+	bytes int64
+}
+
+func newParseCache(size int, maxBytes int64) *parseCache {
+	return &parseCache{
+		size:     size,
+		maxBytes: maxBytes,
+		order:    list.New(),
+		entries:  make(map[string]*list.Element, size),
+	}
+}
+
+// mineruParseCache is shared by MinerUReader and MinerUCloudReader; keys
+// include the engine name and options so results never cross engines.
+var mineruParseCache = newParseCache(parseCacheSize, parseCacheMaxBytes)
+
+// parseCacheKey hashes the engine, its effective options and the content.
+func parseCacheKey(engine, options string, content []byte) string {
+	h := sha256.New()
+	h.Write([]byte(engine))
+	h.Write([]byte{0})
+	h.Write([]byte(options))
+	h.Write([]byte{0})
+	h.Write(content)
+	return hex.EncodeToString(h.Sum(nil))
+}
+
+// get returns a copy of the cached document so callers may append to its
+// image refs without touching the cached entry.
+func (c *parseCache) get(key string) (parsedDocument, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	el, ok := c.entries[key]
+	if !ok {
+		return parsedDocument{}, false
+	}
+	c.order.MoveToFront(el)
+	doc := el.Value.(*parseCacheEntry).doc
+	doc.imageRefs = slices.Clone(doc.imageRefs)
+	return doc, true
+}
+
+// footprint approximates the heap held by a cached document: the markdown
+// plus every decoded image.
+func (d parsedDocument) footprint() int64 {
+	n := int64(len(d.markdown))
+	for _, ref := range d.imageRefs {
+		n += int64(len(ref.ImageData))
+	}
+	return n
+}
+
+func (c *parseCache) put(key string, doc parsedDocument) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if el, ok := c.entries[key]; ok {
+		c.remove(el)
+	}
+	n := doc.footprint()
+	if n > c.maxBytes {
+		return
+	}
+	doc.imageRefs = slices.Clone(doc.imageRefs)
+	c.entries[key] = c.order.PushFront(&parseCacheEntry{key: key, doc: doc, bytes: n})
+	c.bytes += n
+	for c.order.Len() > c.size || c.bytes > c.maxBytes {
+		c.remove(c.order.Back())
+	}
+}
+
+// remove drops el from the cache; the caller must hold c.mu.
+func (c *parseCache) remove(el *list.Element) {
+	entry := c.order.Remove(el).(*parseCacheEntry)
+	delete(c.entries, entry.key)
+	c.bytes -= entry.bytes
+}
@@ -0,0 +1,93 @@
+package docparser
+
+import (
+	"testing"
+
+	"github.com/Tencent/WeKnora/internal/types"
+)
+
+func TestParseCacheEvictsLeastRecentlyUsed(t *testing.T) {
+	c := newParseCache(2, parseCacheMaxBytes)
+	c.put("a", parsedDocument{markdown: "A"})
+	c.put("b", parsedDocument{markdown: "B"})
+
+	// Touch "a" so "b" becomes the eviction candidate.
+	if _, ok := c.get("a"); !ok {
+		t.Fatal("expected hit for a")
+	}
+	c.put("c", parsedDocument{markdown: "C"})
+
+	if _, ok := c.get("b"); ok {
+		t.Error("expected b to be evicted")
+	}
+	for _, key := range []string{"a", "c"} {
+		if _, ok := c.get(key); !ok {
+			t.Errorf("expected hit for %s", key)
+		}
+	}
+}
+
+func TestParseCacheEvictsByBytes(t *testing.T) {
+	c := newParseCache(8, 100)
+	image := func(n int) []types.ImageRef {
+		return []types.ImageRef{{Filename: "1.png", ImageData: make([]byte, n)}}
+	}
+	c.put("a", parsedDocument{markdown: "0123456789", imageRefs: image(30)}) // 40 bytes
+	c.put("b", parsedDocument{markdown: "0123456789", imageRefs: image(30)}) // 40 bytes
+	c.put("c", parsedDocument{markdown: "0123456789", imageRefs: image(30)}) // 40 bytes, evicts a
+
+	if _, ok := c.get("a"); ok {
+		t.Error("expected a to be evicted to stay under the byte budget")
+	}
+	for _, key := range []string{"b", "c"} {
+		if _, ok := c.get(key); !ok {
+			t.Errorf("expected hit for %s", key)
+		}
+	}
+	if c.bytes != 80 {
+		t.Errorf("expected 80 cached bytes, got %d", c.bytes)
+	}
+
+	// Replacing an entry accounts for the new size only.
+	c.put("c", parsedDocument{markdown: "0123456789"})
+	if c.bytes != 50 {
+		t.Errorf("expected 50 cached bytes after replace, got %d", c.bytes)
+	}
+}
+
+func TestParseCacheSkipsOversizedDocuments(t *testing.T) {
+	c := newParseCache(8, 100)
+	c.put("small", parsedDocument{markdown: "md"})
+	c.put("big", parsedDocument{imageRefs: []types.ImageRef{{ImageData: make([]byte, 101)}}})
+
+	if _, ok := c.get("big"); ok {
+		t.Error("expected oversized document not to be cached")
+	}
+	if _, ok := c.get("small"); !ok {
+		t.Error("expected oversized document not to evict others")
+	}
+}
+
+func TestParseCacheReturnsCopies(t *testing.T) {
+	c := newParseCache(4, parseCacheMaxBytes)
+	c.put("k", parsedDocument{markdown: "md", imageRefs: []types.ImageRef{{Filename: "1.png"}}})
+
+	doc, _ := c.get("k")
+	doc.imageRefs = append(doc.imageRefs, types.ImageRef{Filename: "2.png"})
+	doc.imageRefs[0].Filename = "changed.png"
+
+	again, _ := c.get("k")
+	if len(again.imageRefs) != 1 || again.imageRefs[0].Filename != "1.png" {
+		t.Errorf("cached entry was mutated: %+v", again.imageRefs)
+	}
+}
+
+func TestParseCacheKeySeparatesEngines(t *testing.T) {
+	content := []byte("%PDF-1.7")
+	if parseCacheKey("mineru", "opts", content) == parseCacheKey("mineru_cloud", "opts", content) {
+		t.Error("expected distinct keys for different engines")
+	}
+	if parseCacheKey("mineru", "a", content) == parseCacheKey("mineru", "b", content) {
+		t.Error("expected distinct keys for different options")
+	}
+}
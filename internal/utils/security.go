@@ -722,6 +722,11 @@ type SSRFSafeHTTPClientConfig struct {
 	MaxRedirects       int
 	DisableKeepAlives  bool
 	DisableCompression bool
+	// MaxIdleConnsPerHost overrides the per-host idle pool size (0 keeps the
+	// net/http default of 2). Raise it for clients shared across goroutines.
+	MaxIdleConnsPerHost int
+	// ForceAttemptHTTP2 enables HTTP/2 negotiation despite the custom dialer.
+	ForceAttemptHTTP2 bool
 }
 
 // DefaultSSRFSafeHTTPClientConfig returns the default configuration
@@ -741,8 +746,10 @@ var ErrSSRFRedirectBlocked = fmt.Errorf("redirect blocked: target URL failed SSR
 // This prevents SSRF attacks via HTTP redirects where an attacker's server redirects to internal services.
 func NewSSRFSafeHTTPClient(config SSRFSafeHTTPClientConfig) *http.Client {
 	transport := &http.Transport{
-		DisableKeepAlives:  config.DisableKeepAlives,
-		DisableCompression: config.DisableCompression,
+		DisableKeepAlives:   config.DisableKeepAlives,
+		DisableCompression:  config.DisableCompression,
+		MaxIdleConnsPerHost: config.MaxIdleConnsPerHost,
+		ForceAttemptHTTP2:   config.ForceAttemptHTTP2,
 		// Dial with SSRF protection - validates resolved IPs before connecting
 		DialContext: ssrfSafeDialContext,
 	}
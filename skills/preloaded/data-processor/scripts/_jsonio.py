@@ -0,0 +1,73 @@
+"""
+JSON 读写辅助模块 - 供 data-processor 各脚本共用
+
+可用时使用 orjson 加速解析与序列化，否则回退到标准库 json。两种情况下输出的结构、
+分隔符与缩进一致，仅浮点数的指数写法可能不同（如 orjson 输出 1e-7，标准库输出 1e-07）。
+"""
+
+import json
+import math
+
+try:
+    import orjson
+except ImportError:  # 沙箱镜像默认仅提供标准库
+    orjson = None
+
+
+# orjson 会把超出 64 位的整数静默解析为浮点数。数字映射为 "0"、小数点保留、其余映射为空格后，
+# 查找前面不是数字或小数点的 19 位连续数字，即可快速发现可能越界的整数
+_DIGIT_SHAPE = bytes(48 if 48 <= b <= 57 else b if b == 46 else 32 for b in range(256))
+_WIDE_INT = b" " + b"0" * 19
+
+
+def _has_wide_int(raw: bytes) -> bool:
+    """粗略判断 JSON 中是否含有 19 位及以上的整数（宁可误判，误判时仅回退到标准库）"""
+    shape = raw.translate(_DIGIT_SHAPE)
+    return shape.startswith(_WIDE_INT[1:]) or _WIDE_INT in shape
+
+
+def loads(raw):
+    """解析 JSON 文本或 UTF-8 字节，优先使用 orjson；orjson 不接受的输入（如 NaN）或可能含超长整数时回退到标准库"""
+    if orjson is not None:
+        encoded = raw.encode("utf-8", "surrogatepass") if isinstance(raw, str) else raw
+        if not _has_wide_int(encoded):
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(raw)
+
+
+def _has_non_finite(obj) -> bool:
+    """判断对象中是否含有 NaN 或 ±Infinity 浮点数"""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def dumps(obj, pretty: bool = False) -> str:
+    """序列化 JSON 输出，优先使用 orjson（输出 UTF-8，等同 ensure_ascii=False）
+
+    非缩进输出与 orjson 一样不带空格（分隔符为 "," 与 ":"）。
+    """
+    if orjson is not None:
+        try:
+            out = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except TypeError:  # orjson 不支持的值（如超过 64 位的整数）
+            pass
+        else:
+            # orjson 把 NaN/Infinity 写为 null，标准库写为 NaN/Infinity；
+            # 仅在输出含 null 时才检查，含非有限浮点数则交给标准库以保持输出一致
+            if b"null" not in out or not _has_non_finite(obj):
+                return out.decode("utf-8")
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
@@ -21,7 +21,79 @@
 import sys
 import json
 import argparse
-from collections import Counter
+from collections import Counter, defaultdict
+
+from _jsonio import dumps, loads
+
+
+# 词频统计时需要从词首尾去除的标点符号
+_PUNCT = ".,!?;:\"'()[]{}"
+
+# 数据量达到该阈值时才使用 NumPy，小数据集纯 Python 更快
+_NUMPY_MIN_SIZE = 1000
+
+_numpy = None
+
+
+def _get_numpy():
+    """按需导入 NumPy（沙箱镜像默认仅提供标准库），不可用时返回 None"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+def _single_numeric_type(numbers: list) -> bool:
+    """判断数值是否全为 int 或全为 float（bool 虽是 int 的子类，但不计入）"""
+    types = set(map(type, numbers))
+    return types == {int} or types == {float}
+
+
+def _analyze_numeric_numpy(np, numbers: list):
+    """使用 NumPy 计算数值统计，无法安全向量化时返回 None"""
+    arr = np.asarray(numbers)
+    if arr.dtype.kind not in "iuf":
+        return None
+    n = arr.size
+    if arr.dtype.kind in "iu" and max(-int(arr.min()), int(arr.max())) * n >= 2 ** 63:
+        # 整数求和可能溢出 int64，退回纯 Python 路径
+        return None
+    
+    total = arr.sum().item()
+    # 与纯 Python 路径取相同下标的顺序统计量，partition 无需完整排序
+    kth = sorted({n // 4, n // 2 - 1 if n % 2 == 0 else n // 2, n // 2, 3 * n // 4})
+    part = np.partition(arr, kth)
+    if n % 2 == 1:
+        median = part[n // 2].item()
+    else:
+        median = (part[n // 2 - 1].item() + part[n // 2].item()) / 2
+    
+    if arr.dtype.kind in "iu":
+        # 标准差与平移无关，先减去最小值再转换为浮点数，避免超过 2**53 的整数丢失精度
+        std_dev = float((arr - arr.min()).std())
+    else:
+        std_dev = float(arr.std())
+    
+    result = {
+        "count": n,
+        "sum": total,
+        "mean": total / n,
+        "min": arr.min().item(),
+        "max": arr.max().item(),
+        "median": median,
+        "std_dev": std_dev,
+    }
+    if n >= 5:
+        result["quartiles"] = {
+            "q1": part[n // 4].item(),
+            "q2": median,
+            "q3": part[3 * n // 4].item()
+        }
+    return result
 
 
 def analyze_numeric(data: list) -> dict:
@@ -34,6 +106,15 @@ def analyze_numeric(data: list) -> dict:
     if not numbers:
         return {"error": "无有效数值数据"}
     
+    # 仅在全为整数或全为浮点数时使用 NumPy：混合类型会被转换为 float64，
+    # 既改变整数结果的类型，也会丢失超过 2**53 的整数精度
+    if len(numbers) >= _NUMPY_MIN_SIZE and _single_numeric_type(numbers):
+        np = _get_numpy()
+        if np is not None:
+            result = _analyze_numeric_numpy(np, numbers)
+            if result is not None:
+                return result
+    
     numbers.sort()
     n = len(numbers)
     
@@ -67,26 +148,27 @@ def analyze_text(data: list) -> dict:
     if not data:
         return {"error": "空数据集"}
     
-    texts = [str(x) for x in data if x]
-    
-    # 基本统计
-    total_chars = sum(len(t) for t in texts)
-    total_words = sum(len(t.split()) for t in texts)
-    
-    # 词频统计（简单分词）
-    all_words = []
-    for text in texts:
+    # 一次遍历同时完成计数、字符数、词数和词频统计（简单分词，去除词首尾标点）
+    count = 0
+    total_chars = 0
+    total_words = 0
+    word_freq = Counter()
+    for item in data:
+        if not item:
+            continue
+        text = str(item)
+        count += 1
+        total_chars += len(text)
         words = text.split()
-        all_words.extend(w.strip('.,!?;:""\'()[]{}') for w in words if w.strip())
-    
-    word_freq = Counter(all_words)
+        total_words += len(words)
+        word_freq.update(s for w in words if (s := w.strip(_PUNCT)))
     
     result = {
-        "count": len(texts),
+        "count": count,
         "total_chars": total_chars,
         "total_words": total_words,
-        "avg_chars_per_item": total_chars / len(texts) if texts else 0,
-        "avg_words_per_item": total_words / len(texts) if texts else 0,
+        "avg_chars_per_item": total_chars / count if count else 0,
+        "avg_words_per_item": total_words / count if count else 0,
         "top_words": dict(word_freq.most_common(10)),
         "unique_words": len(word_freq)
     }
@@ -132,19 +214,22 @@ def analyze_dict_list(data: list) -> dict:
         "fields": {},
     }
     
-    # 获取所有字段
-    all_keys = set()
+    # 一次遍历收集每个字段的非空值和空值计数（字段按首次出现顺序排列）
+    field_values = defaultdict(list)
+    null_counts = Counter()
     for item in data:
-        all_keys.update(item.keys())
+        for key, value in item.items():
+            values = field_values[key]
+            if value is None:
+                null_counts[key] += 1
+            else:
+                values.append(value)
     
     # 分析每个字段
-    for key in all_keys:
-        values = [item.get(key) for item in data if key in item]
-        
+    for key, non_null_values in field_values.items():
         # 判断字段类型
-        non_null_values = [v for v in values if v is not None]
         if not non_null_values:
-            result["fields"][key] = {"type": "all_null", "null_count": len(values)}
+            result["fields"][key] = {"type": "all_null", "null_count": null_counts[key]}
             continue
         
         sample = non_null_values[0]
@@ -157,7 +242,7 @@ def analyze_dict_list(data: list) -> dict:
         else:
             field_analysis = {"type": type(sample).__name__, "count": len(non_null_values)}
         
-        field_analysis["null_count"] = len(values) - len(non_null_values)
+        field_analysis["null_count"] = null_counts[key]
         result["fields"][key] = field_analysis
     
     return result
@@ -183,7 +268,7 @@ def main():
             print(json.dumps({"error": "空输入"}))
             return
         
-        data = json.loads(raw_data)
+        data = loads(raw_data)
     except json.JSONDecodeError as e:
         print(json.dumps({"error": f"JSON 解析错误: {str(e)}"}))
         return
@@ -242,8 +327,7 @@ def main():
     }
     
     # 输出
-    indent = 2 if args.pretty else None
-    print(json.dumps(output, ensure_ascii=False, indent=indent))
+    print(dumps(output, pretty=args.pretty))
 
 
 if __name__ == "__main__":
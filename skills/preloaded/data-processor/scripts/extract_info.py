@@ -22,13 +22,61 @@ import sys
 import json
 import argparse
 import re
+from collections import Counter
+
+from _jsonio import dumps
+
+
+def _compile_alternation(patterns: tuple) -> "re.Pattern":
+    """将多个模式合并为一个交替表达式，一次扫描即可匹配全部模式
+
+    按顺序优先匹配靠前的模式，因此更具体（更长）的模式应放在前面；
+    已被较长模式匹配的文本不会再被较短模式重复匹配。
+    """
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+
+# 预编译正则表达式，避免每次调用时重复查找编译缓存
+_NUMBER_PATTERN = re.compile(r'-?\d+(?:\.\d+)?')  # 整数和小数
+
+_DATE_PATTERN = _compile_alternation((
+    r'\d{4}[-/年]\d{1,2}[-/月]\d{1,2}[日]?',  # 2024-01-01 或 2024年1月1日
+    r'\d{4}[-/年]\d{1,2}[月]?',                 # 2024-01 或 2024年1月
+    r'\d{4}年',                                  # 2024年
+    r'\d{1,2}[-/月]\d{1,2}[日]?',              # 01-01 或 1月1日
+))
+
+_PERCENTAGE_PATTERN = re.compile(r'-?\d+(?:\.\d+)?%')
+
+_AMOUNT_PATTERN = _compile_alternation((
+    r'[¥$€£]\s*\d+(?:,\d{3})*(?:\.\d+)?',      # ¥100.00
+    r'\d+(?:\.\d+)?[百千万亿]+[元]?',            # 100万 或 100万元
+    r'\d+(?:,\d{3})*(?:\.\d+)?\s*[元万亿美金]', # 100元
+))
+
+_EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+_URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+_PHONE_PATTERN = _compile_alternation((
+    r'\+\d{1,3}[-\s]?\d{10,12}',             # 国际号码
+    r'1[3-9]\d{9}',                           # 手机号
+    r'\d{3,4}[-\s]?\d{7,8}',                  # 固话
+))
+
+_CHINESE_WORD_PATTERN = re.compile(r'[\u4e00-\u9fa5]{2,}')  # 中文关键词
+_ENGLISH_WORD_PATTERN = re.compile(r'[a-zA-Z]{3,}')         # 英文关键词
+
+# 停用词
+_STOPWORDS = frozenset({
+    '的', '是', '在', '了', '和', '与', '或', '为', '有', '这', '那', '等',
+    'the', 'is', 'are', 'was', 'were', 'and', 'or', 'for', 'with', 'this',
+})
 
 
 def extract_numbers(text: str) -> list:
     """提取数字"""
-    # 匹配整数和小数
-    pattern = r'-?\d+(?:\.\d+)?'
-    numbers = re.findall(pattern, text)
+    numbers = _NUMBER_PATTERN.findall(text)
     # 转换为数值
     result = []
     for n in numbers:
@@ -44,91 +92,48 @@ def extract_numbers(text: str) -> list:
 
 def extract_dates(text: str) -> list:
     """提取日期"""
-    patterns = [
-        r'\d{4}[-/年]\d{1,2}[-/月]\d{1,2}[日]?',  # 2024-01-01 或 2024年1月1日
-        r'\d{4}[-/年]\d{1,2}[月]?',                 # 2024-01 或 2024年1月
-        r'\d{4}年',                                  # 2024年
-        r'\d{1,2}[-/月]\d{1,2}[日]?',              # 01-01 或 1月1日
-    ]
-    
-    dates = []
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        dates.extend(matches)
-    
-    return list(set(dates))
+    # 去重并保持出现顺序
+    return list(dict.fromkeys(_DATE_PATTERN.findall(text)))
 
 
 def extract_percentages(text: str) -> list:
     """提取百分比"""
-    pattern = r'-?\d+(?:\.\d+)?%'
-    return re.findall(pattern, text)
+    return _PERCENTAGE_PATTERN.findall(text)
 
 
 def extract_amounts(text: str) -> list:
     """提取金额"""
-    patterns = [
-        r'[¥$€£]\s*\d+(?:,\d{3})*(?:\.\d+)?',      # ¥100.00
-        r'\d+(?:,\d{3})*(?:\.\d+)?\s*[元万亿美金]', # 100万元
-        r'\d+(?:\.\d+)?[百千万亿]+[元]?',            # 100万
-    ]
-    
-    amounts = []
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        amounts.extend(matches)
-    
-    return list(set(amounts))
+    return list(dict.fromkeys(_AMOUNT_PATTERN.findall(text)))
 
 
 def extract_emails(text: str) -> list:
     """提取邮箱"""
-    pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    return re.findall(pattern, text)
+    return _EMAIL_PATTERN.findall(text)
 
 
 def extract_urls(text: str) -> list:
     """提取 URL"""
-    pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-    return re.findall(pattern, text)
+    return _URL_PATTERN.findall(text)
 
 
 def extract_phones(text: str) -> list:
     """提取电话号码"""
-    patterns = [
-        r'1[3-9]\d{9}',                           # 手机号
-        r'\d{3,4}[-\s]?\d{7,8}',                  # 固话
-        r'\+\d{1,3}[-\s]?\d{10,12}',             # 国际号码
-    ]
-    
-    phones = []
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        phones.extend(matches)
-    
-    return list(set(phones))
+    return list(dict.fromkeys(_PHONE_PATTERN.findall(text)))
 
 
 def extract_keywords(text: str, min_len: int = 2) -> list:
     """提取关键词（中文和英文）"""
-    # 中文关键词
-    chinese_pattern = r'[\u4e00-\u9fa5]{2,}'
-    chinese_words = re.findall(chinese_pattern, text)
-    
-    # 英文关键词
-    english_pattern = r'[a-zA-Z]{3,}'
-    english_words = re.findall(english_pattern, text)
-    
-    # 统计词频
-    from collections import Counter
-    words = chinese_words + [w.lower() for w in english_words]
+    # 统计词频（直接流式计数，不生成中间词列表）
+    word_freq = Counter(m.group() for m in _CHINESE_WORD_PATTERN.finditer(text))
+    word_freq.update(m.group().lower() for m in _ENGLISH_WORD_PATTERN.finditer(text))
     
-    # 过滤停用词
-    stopwords = {'的', '是', '在', '了', '和', '与', '或', '为', '有', '这', '那', '等',
-                 'the', 'is', 'are', 'was', 'were', 'and', 'or', 'for', 'with', 'this'}
-    words = [w for w in words if w not in stopwords and len(w) >= min_len]
+    # 过滤停用词和过短的词
+    for w in _STOPWORDS:
+        word_freq.pop(w, None)
+    if min_len > 2:  # 中文词至少 2 字、英文词至少 3 字母，默认无需再过滤
+        for w in [w for w in word_freq if len(w) < min_len]:
+            del word_freq[w]
     
-    word_freq = Counter(words)
     return [{"word": w, "count": c} for w, c in word_freq.most_common(20)]
 
 
@@ -191,8 +196,7 @@ def main():
     }
     
     # 输出
-    indent = 2 if args.pretty else None
-    print(json.dumps(result, ensure_ascii=False, indent=indent))
+    print(dumps(result, pretty=args.pretty))
 
 
 if __name__ == "__main__":
@@ -16,76 +16,146 @@
 import sys
 import json
 import argparse
-import csv
-import io
+import functools
+import itertools
+import operator
+import re
+
+from _jsonio import dumps, loads
+
+
+# 自动检测格式时用于定位首个非空白字节
+_FIRST_NON_SPACE = re.compile(rb"\S")
+
+# 流式输出时每批写入的行数：逐行调用 sys.stdout.write 的开销远高于拼接，按批拼接后再写入
+_WRITE_BATCH_ROWS = 1024
+
+
+def _collect_fieldnames(data: list) -> tuple:
+    """一次遍历完成类型校验并按首次出现顺序收集所有字段"""
+    fields = {}
+    for item in data:
+        if not isinstance(item, dict):
+            raise ValueError("JSON 数据必须是字典列表")
+        fields.update(dict.fromkeys(item))
+    return tuple(fields)
+
+
+@functools.lru_cache(maxsize=32)
+def _csv_row_getter(fieldnames: tuple, uniform: bool):
+    """返回把字典转换为按字段排列的元组的函数，同一字段集合重复转换时直接复用"""
+    if uniform and len(fieldnames) > 1:
+        # itemgetter 仅在多个字段时返回元组
+        return operator.itemgetter(*fieldnames)
+    return lambda item: tuple(item.get(f, "") for f in fieldnames)
+
+
+@functools.lru_cache(maxsize=32)
+def _md_templates(fieldnames: tuple) -> tuple:
+    """返回 Markdown 表头行与分隔行，同一字段集合重复转换时直接复用"""
+    return (
+        f"| {' | '.join(fieldnames)} |",
+        f"| {' | '.join(['---'] * len(fieldnames))} |",
+    )
 
 
 def json_to_csv(data: list) -> str:
     """将 JSON 列表转换为 CSV"""
-    if not data:
-        return ""
+    import io
     
-    if not all(isinstance(x, dict) for x in data):
-        raise ValueError("JSON 数据必须是字典列表")
+    out = io.StringIO()
+    _write_csv(data, out)
+    return out.getvalue()
+
+
+def _write_csv(data: list, out) -> None:
+    """将 JSON 列表转换为 CSV，分批写入 out"""
+    import csv  # 仅 CSV 转换时才导入
+    import io
     
-    # 获取所有字段
-    fieldnames = []
-    for item in data:
-        for key in item.keys():
-            if key not in fieldnames:
-                fieldnames.append(key)
+    if not data:
+        return
+    
+    fieldnames = _collect_fieldnames(data)
     
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(data)
+    # 预先把字典转换为按字段排列的元组，避免 DictWriter 逐单元格查找。
+    # 实测该路径比 pandas.to_csv 更快，且不会改变数值格式，因此不引入 pandas
+    n_fields = len(fieldnames)
+    # 每行的键都是 fieldnames 的子集，长度相同即字段完全一致
+    uniform = all(len(item) == n_fields for item in data)
+    getter = _csv_row_getter(fieldnames, uniform)
     
-    return output.getvalue()
+    # 按批写入缓冲区后再输出，避免逐行调用 out.write
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(fieldnames)
+    rows = map(getter, data)
+    for _ in range(0, len(data), _WRITE_BATCH_ROWS):
+        writer.writerows(itertools.islice(rows, _WRITE_BATCH_ROWS))
+        out.write(buf.getvalue())
+        buf.seek(0)
+        buf.truncate()
 
 
 def csv_to_json(csv_text: str) -> list:
     """将 CSV 转换为 JSON 列表"""
+    import csv  # 仅 CSV 转换时才导入
+    import io
+    
     reader = csv.DictReader(io.StringIO(csv_text))
     return list(reader)
 
 
-def json_to_markdown(data: list) -> str:
-    """将 JSON 列表转换为 Markdown 表格"""
-    if not data:
+def _fmt_cell(value) -> str:
+    """格式化 Markdown 单元格，仅在包含管道符时才转义"""
+    if value is None:
         return ""
+    text = str(value)
+    return text.replace("|", "\\|") if "|" in text else text
+
+
+def iter_json_to_markdown(data: list):
+    """将 JSON 列表逐行转换为 Markdown 表格，按行生成（不含换行符）"""
+    if not data:
+        return
     
-    if not all(isinstance(x, dict) for x in data):
-        raise ValueError("JSON 数据必须是字典列表")
-    
-    # 获取所有字段
-    fieldnames = []
-    for item in data:
-        for key in item.keys():
-            if key not in fieldnames:
-                fieldnames.append(key)
+    fieldnames = _collect_fieldnames(data)
     
-    # 构建表头
-    lines = []
-    lines.append("| " + " | ".join(fieldnames) + " |")
-    lines.append("| " + " | ".join(["---"] * len(fieldnames)) + " |")
+    # 表头
+    yield from _md_templates(fieldnames)
     
-    # 构建数据行
+    # 数据行（None 与缺失字段输出为空）
     for item in data:
-        row = []
-        for field in fieldnames:
-            value = item.get(field, "")
-            # 转义 Markdown 特殊字符
-            str_value = str(value) if value is not None else ""
-            str_value = str_value.replace("|", "\\|")
-            row.append(str_value)
-        lines.append("| " + " | ".join(row) + " |")
-    
-    return "\n".join(lines)
+        yield f"| {' | '.join([_fmt_cell(item.get(field)) for field in fieldnames])} |"
+
+
+def json_to_markdown(data: list) -> str:
+    """将 JSON 列表转换为 Markdown 表格"""
+    return "\n".join(iter_json_to_markdown(data))
+
+
+def _write_markdown(data: list, out) -> None:
+    """将 JSON 列表转换为 Markdown 表格，分批写入 out"""
+    lines = iter_json_to_markdown(data)
+    # 先取出表头：字段校验失败时不会写入任何内容
+    first = next(lines, None)
+    if first is None:
+        return
+    out.write(first)
+    while batch := list(itertools.islice(lines, _WRITE_BATCH_ROWS)):
+        out.write("\n")
+        out.write("\n".join(batch))
+
+
+def _split_md_row(line: str):
+    """拆分 Markdown 表格行，去除首尾管道符及单元格两侧空白（切分与去空白均由 C 实现的 str 方法完成）"""
+    return map(str.strip, line.strip("|").split("|"))
 
 
 def markdown_to_json(md_text: str) -> list:
     """将 Markdown 表格转换为 JSON 列表"""
-    lines = [line.strip() for line in md_text.strip().split("\n") if line.strip()]
+    # 每行只 strip 一次；空行在过滤时去掉，无需先整体 strip 复制输入
+    lines = [stripped for line in md_text.split("\n") if (stripped := line.strip())]
     
     if len(lines) < 2:
         raise ValueError("无效的 Markdown 表格")
@@ -95,55 +165,107 @@ def markdown_to_json(md_text: str) -> list:
     if not header_line.startswith("|"):
         raise ValueError("无效的 Markdown 表格格式")
     
-    headers = [h.strip() for h in header_line.strip("|").split("|")]
-    
-    # 跳过分隔行
-    data_lines = lines[2:] if len(lines) > 2 else []
+    headers = list(_split_md_row(header_line))
     
-    # 解析数据
-    result = []
-    for line in data_lines:
-        if not line.startswith("|"):
-            continue
-        values = [v.strip() for v in line.strip("|").split("|")]
-        item = {}
-        for i, header in enumerate(headers):
-            if i < len(values):
-                item[header] = values[i]
-        result.append(item)
-    
-    return result
+    # 跳过分隔行后解析数据：字段映射由 zip 按位置完成，
+    # 单元格多于表头时忽略多余部分，少于表头时只保留已有字段
+    return [
+        dict(zip(headers, _split_md_row(line)))
+        for line in itertools.islice(lines, 2, None)
+        if line.startswith("|")
+    ]
+
 
+def _parse_json_input(raw: bytes) -> list:
+    """解析 JSON 输入并统一为列表：对象中的 items / data 字段优先作为数据列表
 
-def detect_format(text: str) -> str:
-    """自动检测输入格式"""
-    text = text.strip()
+    CSV / Markdown 输出需要先遍历全部行收集字段，且输入已整体读入内存，
+    因此直接整体解析，不做按字节预判或流式解析
+    """
+    data = loads(raw)
+    if isinstance(data, dict):
+        # 尝试提取列表
+        if "items" in data:
+            data = data["items"]
+        elif "data" in data:
+            data = data["data"]
+        else:
+            data = [data]
+    if not isinstance(data, list):
+        data = [data]
+    return data
+
+
+def _is_plain_json_array(raw: bytes) -> bool:
+    """判断已解析成功的 JSON 输入是否为 UTF-8 编码的顶层数组（无需提取或包装，可原样输出）"""
+    match = _FIRST_NON_SPACE.search(raw)
+    # UTF-16 / UTF-32 编码的 JSON 必然包含 NUL 字节，合法的 UTF-8 JSON 则不会出现
+    return match is not None and raw[match.start()] in b"[" and b"\x00" not in raw
+
+
+def detect_format(raw: bytes) -> str:
+    """自动检测输入格式（直接检查原始字节中首个非空白字符及其所在行，无需解码或复制整个输入）"""
+    match = _FIRST_NON_SPACE.search(raw)
+    if match is None:
+        return "unknown"
     
-    if text.startswith("[") or text.startswith("{"):
+    start = match.start()
+    first = raw[start]  # 单个字节的整数值，in 判断即一次 C 级查找
+    if first in b"[{":
         return "json"
-    elif text.startswith("|"):
+    elif first in b"|":
         return "markdown"
-    elif "," in text.split("\n")[0]:
+    
+    end = raw.find(b"\n", start)
+    if raw.find(b",", start, len(raw) if end < 0 else end) >= 0:
         return "csv"
-    else:
-        return "unknown"
+    return "unknown"
 
 
-def main():
+def _write_json(data: list, out, pretty: bool) -> None:
+    """将 JSON 列表序列化后写入 out"""
+    out.write(dumps(data, pretty=pretty))
+
+
+# 输入格式 -> 解析函数（原始字节 -> JSON 列表）
+_PARSERS = {
+    "json": _parse_json_input,
+    "csv": lambda raw: csv_to_json(raw.decode("utf-8")),
+    "markdown": lambda raw: markdown_to_json(raw.decode("utf-8")),
+}
+
+# 输出格式 -> 写出函数 (data, out, pretty)，CSV / Markdown 直接流式写入 out，没有格式化选项
+_SERIALIZERS = {
+    "json": _write_json,
+    "csv": lambda data, out, pretty: _write_csv(data, out),
+    "markdown": lambda data, out, pretty: _write_markdown(data, out),
+}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """构建命令行参数解析器"""
     parser = argparse.ArgumentParser(description="数据格式转换工具")
     parser.add_argument("--from", "-f", dest="from_format", 
-                       choices=["json", "csv", "markdown", "auto"],
+                       choices=(*_PARSERS, "auto"),
                        default="auto", help="输入格式")
     parser.add_argument("--to", "-t", dest="to_format",
-                       choices=["json", "csv", "markdown"],
+                       choices=tuple(_SERIALIZERS),
                        required=True, help="输出格式")
     parser.add_argument("--pretty", "-p", action="store_true", help="格式化输出")
-    args = parser.parse_args()
+    return parser
+
+
+# 模块加载时构建一次，重复调用 main() 时复用
+_PARSER = _build_parser()
+
+
+def main():
+    args = _PARSER.parse_args()
     
-    # 读取输入
+    # 读取输入（按字节读取，JSON 直接交给解析器，CSV / Markdown 才解码为文本）
     try:
-        raw_input = sys.stdin.read()
-        if not raw_input.strip():
+        raw_bytes = sys.stdin.buffer.read()
+        if not raw_bytes.strip():
             print(json.dumps({"error": "空输入"}))
             return
     except Exception as e:
@@ -153,50 +275,37 @@ def main():
     # 检测输入格式
     from_format = args.from_format
     if from_format == "auto":
-        from_format = detect_format(raw_input)
+        from_format = detect_format(raw_bytes)
         if from_format == "unknown":
             print(json.dumps({"error": "无法自动检测输入格式"}))
             return
     
     # 转换为中间格式（JSON 列表）
+    parse = _PARSERS.get(from_format)
+    if parse is None:
+        print(json.dumps({"error": f"不支持的输入格式: {from_format}"}))
+        return
     try:
-        if from_format == "json":
-            data = json.loads(raw_input)
-            if isinstance(data, dict):
-                # 尝试提取列表
-                if "items" in data:
-                    data = data["items"]
-                elif "data" in data:
-                    data = data["data"]
-                else:
-                    data = [data]
-            if not isinstance(data, list):
-                data = [data]
-        elif from_format == "csv":
-            data = csv_to_json(raw_input)
-        elif from_format == "markdown":
-            data = markdown_to_json(raw_input)
-        else:
-            print(json.dumps({"error": f"不支持的输入格式: {from_format}"}))
-            return
+        data = parse(raw_bytes)
     except Exception as e:
         print(json.dumps({"error": f"解析输入失败: {str(e)}"}))
         return
     
     # 转换为目标格式
+    serialize = _SERIALIZERS.get(args.to_format)
+    if serialize is None:
+        print(json.dumps({"error": f"不支持的输出格式: {args.to_format}"}))
+        return
     try:
-        if args.to_format == "json":
-            indent = 2 if args.pretty else None
-            output = json.dumps(data, ensure_ascii=False, indent=indent)
-        elif args.to_format == "csv":
-            output = json_to_csv(data)
-        elif args.to_format == "markdown":
-            output = json_to_markdown(data)
+        if (from_format == "json" and args.to_format == "json" and not args.pretty
+                and _is_plain_json_array(raw_bytes)):
+            # 输入已是解析成功的 JSON 数组，原样输出，省去重新序列化
+            sys.stdout.flush()
+            sys.stdout.buffer.write(raw_bytes.strip())
         else:
-            print(json.dumps({"error": f"不支持的输出格式: {args.to_format}"}))
-            return
+            serialize(data, sys.stdout, args.pretty)
         
-        print(output)
+        sys.stdout.write("\n")
     except Exception as e:
         print(json.dumps({"error": f"转换失败: {str(e)}"}))
         return
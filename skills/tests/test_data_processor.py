@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+data-processor 技能脚本测试
+
+测试代码放在技能目录之外，避免被技能加载器列出或挂载进沙箱。
+
+用法:
+    python -m unittest discover -s skills/tests
+"""
+
+import io
+import random
+import statistics
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "preloaded" / "data-processor" / "scripts"))
+
+import _jsonio  # noqa: E402
+import analyze  # noqa: E402
+import format_converter  # noqa: E402
+
+
+def _numpy_available() -> bool:
+    return analyze._get_numpy() is not None
+
+
+def _analyze_pure(numbers: list) -> dict:
+    """强制走纯 Python 路径"""
+    with mock.patch.object(analyze, "_get_numpy", return_value=None):
+        return analyze.analyze_numeric(numbers)
+
+
+class NumericGateTest(unittest.TestCase):
+    """不满足条件时应直接走纯 Python 路径，无需 NumPy"""
+
+    def test_single_numeric_type(self):
+        self.assertTrue(analyze._single_numeric_type([1, 2, 3]))
+        self.assertTrue(analyze._single_numeric_type([1.0, 2.5]))
+        self.assertFalse(analyze._single_numeric_type([1, 2.5]))
+        self.assertFalse(analyze._single_numeric_type([True, 1]))
+        self.assertFalse(analyze._single_numeric_type([True, False]))
+
+    def _assert_pure(self, numbers: list) -> dict:
+        with mock.patch.object(analyze, "_get_numpy") as get_numpy, \
+                mock.patch.object(analyze, "_analyze_numeric_numpy") as numpy_path:
+            result = analyze.analyze_numeric(numbers)
+        get_numpy.assert_not_called()
+        numpy_path.assert_not_called()
+        return result
+
+    def test_small_input_skips_numpy(self):
+        result = self._assert_pure([5, 1, 4, 2, 3])
+        self.assertEqual(result, {
+            "count": 5,
+            "sum": 15,
+            "mean": 3.0,
+            "min": 1,
+            "max": 5,
+            "median": 3,
+            "std_dev": 2 ** 0.5,
+            "quartiles": {"q1": 2, "q2": 3, "q3": 4},
+        })
+
+    def test_mixed_types_skip_numpy(self):
+        numbers = [2 ** 53 + 1] + [0.5] * analyze._NUMPY_MIN_SIZE
+        result = self._assert_pure(numbers)
+        self.assertEqual(result["max"], 2 ** 53 + 1)
+        self.assertIs(type(result["max"]), int)
+
+    def test_bools_skip_numpy(self):
+        result = self._assert_pure([True, 2] * analyze._NUMPY_MIN_SIZE)
+        self.assertIs(result["min"], True)
+
+    def test_missing_numpy_falls_back(self):
+        numbers = list(range(analyze._NUMPY_MIN_SIZE))
+        with mock.patch.object(analyze, "_get_numpy", return_value=None):
+            result = analyze.analyze_numeric(numbers)
+        self.assertEqual(result["sum"], sum(numbers))
+        self.assertEqual(result["median"], (numbers[499] + numbers[500]) / 2)
+
+
+@unittest.skipUnless(_numpy_available(), "未安装 NumPy")
+class NumpyPathTest(unittest.TestCase):
+    """NumPy 路径与纯 Python 路径的结果应一致"""
+
+    def setUp(self):
+        self.rng = random.Random(42)
+        self.size = analyze._NUMPY_MIN_SIZE + 1
+
+    def _analyze_numpy(self, numbers: list) -> dict:
+        with mock.patch.object(analyze, "_analyze_numeric_numpy",
+                               wraps=analyze._analyze_numeric_numpy) as spy:
+            result = analyze.analyze_numeric(list(numbers))
+        self.assertTrue(spy.called, "未走 NumPy 路径")
+        return result
+
+    def assertSameStats(self, got: dict, want: dict):
+        # 求和顺序不同（NumPy 为成对求和），浮点结果只比较近似值
+        self.assertEqual(got.keys(), want.keys())
+        for key in ("count", "min", "max", "median", "quartiles"):
+            self.assertEqual(got[key], want[key], key)
+            self.assertEqual(type(got[key]), type(want[key]), key)
+        for key in ("sum", "mean", "std_dev"):
+            self.assertAlmostEqual(got[key], want[key], delta=abs(want[key]) * 1e-9, msg=key)
+
+    def test_ints(self):
+        numbers = [self.rng.randint(-10 ** 6, 10 ** 6) for _ in range(self.size)]
+        got = self._analyze_numpy(numbers)
+        want = _analyze_pure(numbers)
+        self.assertSameStats(got, want)
+        self.assertEqual(got["sum"], want["sum"])
+
+    def test_ints_beyond_float_precision(self):
+        base = 2 ** 53
+        numbers = [base + self.rng.randint(0, 1000) for _ in range(self.size)]
+        got = self._analyze_numpy(numbers)
+        want = _analyze_pure(numbers)
+        # 纯 Python 路径的标准差同样按浮点数计算，此处改为与精确值比较
+        self.assertAlmostEqual(got.pop("std_dev"), statistics.pstdev(numbers), places=6)
+        want.pop("std_dev")
+        for key in ("count", "sum", "min", "max", "median", "quartiles"):
+            self.assertEqual(got[key], want[key], key)
+        self.assertIs(type(got["max"]), int)
+
+    def test_int64_min_does_not_overflow(self):
+        # np.abs(int64 最小值) 仍为负数，溢出检查必须用 Python 整数计算
+        numbers = [-2 ** 63, -1] + [0] * self.size
+        result = analyze.analyze_numeric(numbers)
+        self.assertEqual(result["sum"], -2 ** 63 - 1)
+        self.assertEqual(result, _analyze_pure(numbers))
+
+    def test_floats(self):
+        numbers = [self.rng.uniform(-1000, 1000) for _ in range(self.size)]
+        self.assertSameStats(self._analyze_numpy(numbers), _analyze_pure(numbers))
+
+    def test_even_count(self):
+        numbers = [self.rng.randint(0, 100) for _ in range(self.size + 1)]
+        self.assertSameStats(self._analyze_numpy(numbers), _analyze_pure(numbers))
+
+
+
+def _write_json_stdlib(data: list, pretty: bool) -> str:
+    """禁用 orjson，按沙箱默认镜像（仅标准库）输出"""
+    out = io.StringIO()
+    with mock.patch.object(_jsonio, "orjson", None):
+        format_converter._write_json(data, out, pretty)
+    return out.getvalue()
+
+
+class JsonOutputTest(unittest.TestCase):
+    """JSON 输出不应依赖运行环境是否安装了 orjson"""
+
+    rows = [
+        {"name": "中文", "value": 1, "ratio": 0.5, "ok": True, "tags": [], "extra": None},
+        {"name": "B", "value": -2, "nested": {"a": [1, 2.25]}},
+    ]
+
+    def test_stdlib_compact_output(self):
+        self.assertEqual(_write_json_stdlib([{"a": 1}, {"b": [1, 2]}], pretty=False),
+                         '[{"a":1},{"b":[1,2]}]')
+
+    def test_stdlib_pretty_output(self):
+        self.assertEqual(_write_json_stdlib([{"a": 1}], pretty=True),
+                         '[\n  {\n    "a": 1\n  }\n]')
+
+    @unittest.skipUnless(_jsonio.orjson is not None, "未安装 orjson")
+    def test_orjson_matches_stdlib(self):
+        for pretty in (False, True):
+            out = io.StringIO()
+            format_converter._write_json(self.rows, out, pretty)
+            self.assertEqual(out.getvalue(), _write_json_stdlib(self.rows, pretty), f"pretty={pretty}")
+
+    @unittest.skipUnless(_jsonio.orjson is not None, "未安装 orjson")
+    def test_non_finite_floats_match_stdlib(self):
+        rows = [{"a": float("nan"), "b": float("inf")}]
+        out = io.StringIO()
+        format_converter._write_json(rows, out, False)
+        self.assertEqual(out.getvalue(), '[{"a":NaN,"b":Infinity}]')
+        self.assertEqual(out.getvalue(), _write_json_stdlib(rows, False))
+
+
+
+class MarkdownOutputTest(unittest.TestCase):
+    """json_to_markdown 返回字符串，main 使用的流式写出结果与之一致"""
+
+    rows = [{"name": "A", "value": 1}, {"name": "B|C", "note": None}]
+    expected = "| name | value | note |\n| --- | --- | --- |\n| A | 1 |  |\n| B\\|C |  |  |"
+
+    def test_json_to_markdown_returns_string(self):
+        self.assertEqual(format_converter.json_to_markdown(self.rows), self.expected)
+        self.assertEqual(format_converter.json_to_markdown([]), "")
+
+    def test_streaming_writer_matches_string(self):
+        out = io.StringIO()
+        with mock.patch.object(format_converter, "_WRITE_BATCH_ROWS", 1):
+            format_converter._write_markdown(self.rows, out)
+        self.assertEqual(out.getvalue(), self.expected)
+
+    def test_invalid_rows_write_nothing(self):
+        out = io.StringIO()
+        with self.assertRaises(ValueError):
+            format_converter._write_markdown([{"a": 1}, "x"], out)
+        self.assertEqual(out.getvalue(), "")
+
+
+
+class CsvOutputTest(unittest.TestCase):
+    """json_to_csv 返回字符串，main 使用的流式写出结果与之一致"""
+
+    rows = [{"name": "A", "value": 1}, {"name": "B,C", "note": None}]
+    expected = "name,value,note\r\nA,1,\r\n\"B,C\",,\r\n"
+
+    def test_json_to_csv_returns_string(self):
+        self.assertEqual(format_converter.json_to_csv(self.rows), self.expected)
+        self.assertEqual(format_converter.json_to_csv([]), "")
+
+    def test_streaming_writer_matches_string(self):
+        out = io.StringIO()
+        with mock.patch.object(format_converter, "_WRITE_BATCH_ROWS", 1):
+            format_converter._write_csv(self.rows, out)
+        self.assertEqual(out.getvalue(), self.expected)
+
+
+if __name__ == "__main__":
+    unittest.main()